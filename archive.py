@@ -0,0 +1,276 @@
+# ============================================================
+#  Arquivo externo de Pareto (projetos não dominados)
+#  - Guarda até `capacity` pontos (t, k, Q) mutuamente não
+#    dominados, com o genoma de cada um
+#  - Índice em blocos: os pontos ficam ordenados pela curva Z
+#    (código de Morton dos objetivos normalizados), em blocos de
+#    ~`block` linhas; cada bloco cobre um pedaço compacto da
+#    frente e guarda a sua caixa envolvente (mínimo e máximo
+#    por objetivo)
+#  - Inserção: só os blocos cuja caixa permite dominar o novo
+#    ponto (mínimo <= f) ou ser dominado por ele (máximo >= f)
+#    são comparados, linha a linha em NumPy; os demais são
+#    descartados pelas caixas, então o custo acompanha o número
+#    de blocos perto do ponto, não o tamanho do arquivo
+#  - A normalização do código vem dos primeiros pontos; ela só
+#    afeta a velocidade, nunca o resultado
+#  - Cheio: descarta de uma vez os pontos de menor distância de
+#    multidão (extremos sempre ficam)
+#  - Consultas por faixas de objetivos, ex.
+#        archive.query(Q=(110, 120), t=(None, 0.030))
+#  - save/load em .npz, gravação atômica (checkpoint.atomic_savez)
+# ============================================================
+
+import bisect
+
+import numpy as np
+
+from checkpoint import atomic_savez
+from pareto import OBJECTIVES, crowding_distance
+
+
+def morton_codes(values, low, high):
+    """
+    Código de Morton (uint64) de cada linha de `values` (n, M):
+    cada objetivo quantizado em 63 // M bits (no máximo 21) dentro
+    de [low, high] e os bits intercalados.
+    """
+    values = np.atleast_2d(values)
+    n_obj = values.shape[1]
+    bits = min(21, 63 // n_obj)
+    scale = (1 << bits) - 1
+    span = np.where(high > low, high - low, 1.0)
+    q = np.clip((values - low) / span * scale, 0, scale).astype(np.uint64)
+
+    codes = np.zeros(len(values), dtype=np.uint64)
+    for b in range(bits):
+        for j in range(n_obj):
+            bit = (q[:, j] >> np.uint64(b)) & np.uint64(1)
+            codes |= bit << np.uint64(b * n_obj + j)
+    return codes
+
+
+class ParetoArchive:
+    """
+    Conjunto limitado de pontos não dominados (minimização).
+
+    names: nome de cada objetivo (colunas de `values`); um "-" na
+           frente indica coluna com sinal trocado (ver nsga2.objective_values).
+    n_var: tamanho do genoma guardado junto de cada ponto (0 = nenhum).
+    capacity: número máximo de pontos.
+    block: tamanho alvo dos blocos do índice (divididos ao passar de 2x).
+    """
+
+    def __init__(self, names=OBJECTIVES, n_var=2, capacity=100_000, block=64):
+        self.names = tuple(names)
+        self.n_var = n_var
+        self.capacity = capacity
+        self.block = block
+        self._low = self._high = None
+        self._clear()
+
+    def _clear(self):
+        n_obj = len(self.names)
+        self._codes = []             # por bloco: códigos de Morton, crescentes
+        self._values = []            # por bloco: (n, n_obj)
+        self._genomes = []           # por bloco: (n, n_var)
+        self._keys = []              # primeiro código de cada bloco
+        self._lo = np.empty((0, n_obj))
+        self._hi = np.empty((0, n_obj))
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    # ---------- ÍNDICE ----------
+    def _set_block(self, b, codes, values, genomes):
+        self._codes[b] = codes
+        self._values[b] = values
+        self._genomes[b] = genomes
+        self._keys[b] = codes[0]
+        self._lo[b] = values.min(axis=0)
+        self._hi[b] = values.max(axis=0)
+
+    def _new_block(self, b, codes, values, genomes):
+        self._codes.insert(b, codes)
+        self._values.insert(b, values)
+        self._genomes.insert(b, genomes)
+        self._keys.insert(b, codes[0])
+        self._lo = np.insert(self._lo, b, values.min(axis=0), axis=0)
+        self._hi = np.insert(self._hi, b, values.max(axis=0), axis=0)
+
+    def _drop_block(self, b):
+        del self._codes[b], self._values[b], self._genomes[b], self._keys[b]
+        self._lo = np.delete(self._lo, b, axis=0)
+        self._hi = np.delete(self._hi, b, axis=0)
+
+    def _normalize(self, values):
+        """Fixa a faixa do código de Morton pelos pontos dados."""
+        self._low = values.min(axis=0)
+        self._high = values.max(axis=0)
+
+    def _rebuild(self, values, genomes):
+        """Refaz a normalização e os blocos a partir dos pontos dados."""
+        self._clear()
+        if not len(values):
+            return
+        self._normalize(values)
+        codes = morton_codes(values, self._low, self._high)
+        order = np.argsort(codes, kind="stable")
+        codes, values, genomes = codes[order], values[order], genomes[order]
+        for start in range(0, len(values), self.block):
+            stop = start + self.block
+            self._new_block(len(self._values), codes[start:stop].copy(),
+                            values[start:stop].copy(), genomes[start:stop].copy())
+        self._size = len(values)
+
+    # ---------- INSERÇÃO ----------
+    def add(self, values, genomes=None):
+        """
+        Insere um ponto (n_obj,) ou vários (n, n_obj). Pontos
+        dominados por (ou iguais a) algum do arquivo são recusados;
+        os que o novo ponto domina saem. Retorna quantos entraram.
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        if genomes is None:
+            genomes = np.zeros((len(values), self.n_var))
+        genomes = np.atleast_2d(np.asarray(genomes, dtype=float))
+        if not len(values):
+            return 0
+
+        if self._low is None:
+            self._normalize(values)
+        codes = morton_codes(values, self._low, self._high)
+
+        added = 0
+        for c, f, g in zip(codes, values, genomes):
+            added += self._add_one(c, f, g)
+        if self._size > self.capacity:
+            self._truncate()
+        return added
+
+    def _add_one(self, c, f, g):
+        # Alguém do arquivo domina (ou é igual a) f?
+        if self.dominated(f):
+            return False
+
+        # Remove quem f domina (blocos percorridos de trás pra frente)
+        for b in np.flatnonzero(np.all(self._hi >= f, axis=1))[::-1]:
+            dominated = np.all(self._values[b] >= f, axis=1)
+            if not dominated.any():
+                continue
+            self._size -= np.count_nonzero(dominated)
+            if dominated.all():
+                self._drop_block(b)
+            else:
+                keep = ~dominated
+                self._set_block(b, self._codes[b][keep], self._values[b][keep],
+                                self._genomes[b][keep])
+
+        if not self._values:
+            self._new_block(0, np.array([c]), f[None].copy(), g[None].copy())
+            self._size = 1
+            return True
+
+        b = max(bisect.bisect_right(self._keys, c) - 1, 0)
+        i = np.searchsorted(self._codes[b], c, side="right")
+        codes = np.insert(self._codes[b], i, c)
+        values = np.insert(self._values[b], i, f, axis=0)
+        genomes = np.insert(self._genomes[b], i, g, axis=0)
+        if len(values) > 2 * self.block:
+            half = len(values) // 2
+            self._set_block(b, codes[:half], values[:half], genomes[:half])
+            self._new_block(b + 1, codes[half:], values[half:], genomes[half:])
+        else:
+            self._set_block(b, codes, values, genomes)
+        self._size += 1
+        return True
+
+    def _truncate(self):
+        """
+        Volta para abaixo da capacidade descartando os pontos mais
+        aglomerados (1% da capacidade de folga, para não recalcular
+        a distância de multidão a cada inserção).
+        """
+        values, genomes = self.values(), self.genomes()
+        n_keep = self.capacity - self.capacity // 100
+        crowd = crowding_distance(values, np.zeros(len(values), dtype=np.intp))
+        keep = np.argsort(-crowd, kind="stable")[:n_keep]
+        self._rebuild(values[keep], genomes[keep])
+
+    # ---------- CONSULTAS ----------
+    def values(self):
+        """Objetivos de todos os pontos (size, n_obj), na ordem do índice."""
+        if not self._values:
+            return np.empty((0, len(self.names)))
+        return np.concatenate(self._values)
+
+    def genomes(self):
+        """Genomas na mesma ordem de values()."""
+        if not self._genomes:
+            return np.empty((0, self.n_var))
+        return np.concatenate(self._genomes)
+
+    def dominated(self, f):
+        """True se algum ponto do arquivo domina f (ou é igual a ele)."""
+        f = np.asarray(f, dtype=float)
+        for b in np.flatnonzero(np.all(self._lo <= f, axis=1)):
+            if np.any(np.all(self._values[b] <= f, axis=1)):
+                return True
+        return False
+
+    def _column(self, name):
+        """(coluna, sinal) de um objetivo; aceita "k" para uma coluna "-k"."""
+        if name in self.names:
+            return self.names.index(name), 1.0
+        if "-" + name in self.names:
+            return self.names.index("-" + name), -1.0
+        raise KeyError(f"objetivo desconhecido: {name!r} (arquivo tem {self.names})")
+
+    def query(self, **ranges):
+        """
+        Pontos com cada objetivo dentro de (mínimo, máximo) — None deixa
+        o lado aberto, limites inclusivos. Retorna (values, genomes).
+
+            archive.query(Q=(110, 120), t=(None, 0.030))
+        """
+        n_obj = len(self.names)
+        low = np.full(n_obj, -np.inf)
+        high = np.full(n_obj, np.inf)
+        for name, (a, b) in ranges.items():
+            j, sign = self._column(name)
+            a = -np.inf if a is None else a
+            b = np.inf if b is None else b
+            if sign < 0:
+                a, b = -b, -a
+            low[j], high[j] = max(low[j], a), min(high[j], b)
+
+        found_values, found_genomes = [], []
+        for b in np.flatnonzero(np.all((self._hi >= low) & (self._lo <= high), axis=1)):
+            values = self._values[b]
+            inside = np.all((values >= low) & (values <= high), axis=1)
+            found_values.append(values[inside])
+            found_genomes.append(self._genomes[b][inside])
+        if not found_values:
+            return np.empty((0, n_obj)), np.empty((0, self.n_var))
+        return np.concatenate(found_values), np.concatenate(found_genomes)
+
+    # ---------- DISCO ----------
+    def save(self, path):
+        """Grava o arquivo em `path` (.npz), atomicamente."""
+        arrays = {
+            "values": self.values(), "genomes": self.genomes(),
+            "names": np.array(self.names), "capacity": self.capacity, "block": self.block,
+        }
+        atomic_savez(path, arrays, prefix=".archive-")
+
+    @classmethod
+    def load(cls, path):
+        """Lê um arquivo gravado por save."""
+        with np.load(path, allow_pickle=False) as data:
+            archive = cls(
+                tuple(str(name) for name in data["names"]), data["genomes"].shape[1],
+                int(data["capacity"]), int(data["block"]),
+            )
+            archive._rebuild(data["values"], data["genomes"])
+        return archive
@@ -0,0 +1,411 @@
+# ============================================================
+#  Benchmarks dos GAs (cilindro_ga e placa_plana_ga)
+#  - Casos: heat_flow, objective/fitness (escalar e em lote),
+#    um generation_step e run_GA completo
+#  - Grade de pop_size (16 .. 10^6), generations e n_var
+#  - Cada caso é cronometrado como no timeit: `number` chamadas
+#    por amostra (até passar de min_time), `repeat` amostras;
+#    guarda-se o tempo por chamada
+#  - Resultados em JSON (baseline); `compare` aponta regressões
+#    acima de um limiar e sai com código 1
+#  - run_GA da placa também registra o erro relativo de t contra
+#    o ótimo exato (Problem.optimum): precisão x tempo
+#  - Com Numba instalado, casos *_numba medem os kernels de
+#    kernels.py (os demais fixam o motor NumPy)
+#  - `verify` confere que as versões rápidas dão o mesmo resultado
+#    das de referência (fitness em lote x escalar; com Numba,
+#    kernels x NumPy em execuções completas) e sai com código 1
+#    se alguma divergir
+#
+#  Uso:
+#    python benchmarks.py run --out base.json [--quick] [-k filtro]
+#    python benchmarks.py compare base.json novo.json [--threshold 0.10]
+#    python benchmarks.py verify
+# ============================================================
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+import cilindro_ga
+import placa_plana_ga
+from kernels import HAVE_NUMBA, fused_fitness, fused_step, load_kernels
+
+# Grade completa e reduzida (--quick)
+GRID = {
+    "pop_size": (16, 256, 4096, 65536, 1_000_000),
+    "generations": (10, 100),
+    "n_var": (2, 8, 32),
+}
+QUICK_GRID = {
+    "pop_size": (16, 4096, 65536),
+    "generations": (10,),
+    "n_var": (2, 8),
+}
+
+# run_GA só onde pop_size * generations cabe num tempo razoável
+MAX_RUN_WORK = 10_000_000
+
+CILINDRO_BOUNDS = [(0.02, cilindro_ga.PROBLEM.k_max), (0.005, 0.08)]
+
+
+# ---------- CASOS ----------
+def _cilindro_population(pop_size, n_var, rng):
+    bounds = np.array(CILINDRO_BOUNDS + [(0.0, 1.0)] * (n_var - 2))
+    return bounds, rng.uniform(bounds[:, 0], bounds[:, 1], size=(pop_size, n_var))
+
+
+def _placa_population(pop_size, rng):
+    return placa_plana_ga.init_population(pop_size, rng)
+
+
+def cases(grid):
+    """
+    Gera (nome, parâmetros, setup); setup() devolve a função sem
+    argumentos a cronometrar (dados preparados fora da medição).
+    """
+    yield "objective_scalar_cilindro", {}, lambda: (
+        lambda ind=np.array([0.05, 0.03]): cilindro_ga.objective(ind)
+    )
+    yield "fitness_scalar_placa", {}, lambda: (
+        lambda ind=np.array([0.05, 0.06]): placa_plana_ga.fitness(ind)
+    )
+
+    for pop_size in grid["pop_size"]:
+        params = {"pop_size": pop_size}
+
+        def heat_cilindro(pop_size=pop_size):
+            _, pop = _cilindro_population(pop_size, 2, np.random.default_rng(0))
+            k, t = pop[:, 0].copy(), pop[:, 1].copy()
+            return lambda: cilindro_ga.heat_flow(k, t)
+
+        def heat_placa(pop_size=pop_size):
+            pop = _placa_population(pop_size, np.random.default_rng(0))
+            t, k = pop[:, 0].copy(), pop[:, 1].copy()
+            return lambda: placa_plana_ga.heat_flow(k, t)
+
+        def objective_cilindro(pop_size=pop_size):
+            _, pop = _cilindro_population(pop_size, 2, np.random.default_rng(0))
+            out = np.empty(pop_size)
+            return lambda: cilindro_ga.objective_batch(pop, out=out)
+
+        def fitness_placa(pop_size=pop_size):
+            pop = _placa_population(pop_size, np.random.default_rng(0))
+            out = np.empty(pop_size)
+            return lambda: placa_plana_ga.fitness_batch(pop, out=out)
+
+        def step_placa(pop_size=pop_size):
+            rng = np.random.default_rng(0)
+            pop = _placa_population(pop_size, rng)
+            fit = placa_plana_ga.fitness_batch(pop)
+            out = np.empty_like(pop)
+            return lambda: placa_plana_ga.generation_step(pop, fit, rng, out=out)
+
+        def fitness_placa_numba(pop_size=pop_size):
+            pop = _placa_population(pop_size, np.random.default_rng(0))
+            out = np.empty(pop_size)
+            fused_fitness(pop, placa_plana_ga.PROBLEM, out=out)   # compila fora da medição
+            return lambda: fused_fitness(pop, placa_plana_ga.PROBLEM, out=out)
+
+        def step_placa_numba(pop_size=pop_size):
+            rng = np.random.default_rng(0)
+            pop = _placa_population(pop_size, rng)
+            fit = placa_plana_ga.fitness_batch(pop)
+            out = np.empty_like(pop)
+            low, high = np.array(placa_plana_ga.PROBLEM.bounds).T.copy()
+            fused_step(pop, fit, rng, out, low, high)
+            return lambda: fused_step(pop, fit, rng, out, low, high)
+
+        yield "heat_flow_cilindro", params, heat_cilindro
+        yield "heat_flow_placa", params, heat_placa
+        yield "objective_batch_cilindro", params, objective_cilindro
+        yield "fitness_batch_placa", params, fitness_placa
+        yield "generation_step_placa", params, step_placa
+        if HAVE_NUMBA:
+            yield "fitness_batch_placa_numba", params, fitness_placa_numba
+            yield "generation_step_placa_numba", params, step_placa_numba
+
+        for n_var in grid["n_var"]:
+            def step_cilindro(pop_size=pop_size, n_var=n_var):
+                rng = np.random.default_rng(0)
+                bounds, pop = _cilindro_population(pop_size, n_var, rng)
+                fit = cilindro_ga.objective_batch(pop)
+                out = np.empty_like(pop)
+                return lambda: cilindro_ga.generation_step(
+                    pop, fit, bounds, 0.8, 0.3, 0.3, rng, out=out
+                )
+
+            yield "generation_step_cilindro", dict(params, n_var=n_var), step_cilindro
+
+        for generations in grid["generations"]:
+            if pop_size * generations > MAX_RUN_WORK:
+                continue
+            run_params = dict(params, generations=generations)
+
+            def run_cilindro(pop_size=pop_size, generations=generations):
+                return lambda: cilindro_ga.run_GA(
+                    CILINDRO_BOUNDS, pop_size=pop_size, generations=generations, seed=0
+                )
+
+            def run_placa(pop_size=pop_size, generations=generations, backend="numpy"):
+                if backend == "numba":
+                    load_kernels()   # import e compilação fora da medição
+                return lambda: placa_plana_ga.run_GA(
+                    pop_size=pop_size, generations=generations, seed=0, verbose=False,
+                    backend=backend
+                )
+
+            yield "run_GA_cilindro", run_params, run_cilindro
+            yield "run_GA_placa", run_params, run_placa
+            if HAVE_NUMBA:
+                yield "run_GA_placa_numba", run_params, lambda run_placa=run_placa: run_placa(
+                    backend="numba")
+
+
+def _placa_t_error(result):
+    t_exact = float(placa_plana_ga.PROBLEM.optimum().t)
+    return (result[0] - t_exact) / t_exact
+
+
+# Precisão do resultado de cada caso (nome -> função do último retorno)
+SCORES = {"run_GA_placa": _placa_t_error, "run_GA_placa_numba": _placa_t_error}
+
+
+def case_key(name, params):
+    if not params:
+        return name
+    return name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+
+
+# ---------- CRONOMETRAGEM ----------
+def measure(fn, repeat=5, min_time=0.2):
+    """
+    Tempos por chamada (s) de `repeat` amostras, no estilo timeit.
+    Retorna (tempos, number, último valor devolvido por fn).
+    """
+    # Calibra `number` para cada amostra levar pelo menos min_time
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            value = fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            value = fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return np.array(samples), number, value
+
+
+def run_benchmarks(grid=GRID, repeat=5, min_time=0.2, pattern=None, log=print):
+    results = {}
+    for name, params, setup in cases(grid):
+        key = case_key(name, params)
+        if pattern and pattern not in key:
+            continue
+        fn = setup()
+        # run_GA da placa sempre imprime o resultado final
+        with contextlib.redirect_stdout(io.StringIO()):
+            samples, number, value = measure(fn, repeat, min_time)
+        results[key] = {
+            "name": name,
+            "params": params,
+            "min": samples.min(),
+            "median": float(np.median(samples)),
+            "stdev": samples.std(),
+            "number": number,
+            "repeat": repeat,
+        }
+        if "pop_size" in params:
+            results[key]["per_individual"] = samples.min() / params["pop_size"]
+        line = f"{key:60s} {_fmt_time(samples.min())}"
+        if name in SCORES:
+            results[key]["t_error"] = SCORES[name](value)
+            line += f"   erro t {results[key]['t_error']:+.2e}"
+        log(line)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def _fmt_time(seconds):
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+# ---------- COMPARAÇÃO ----------
+def compare(base, new, threshold=0.10, stat="min"):
+    """
+    Compara dois JSON de run_benchmarks. Devolve uma lista de
+    (chave, tempo_base, tempo_novo, razão, status) com status
+    "regressão", "melhora" ou "ok" (|razão - 1| <= threshold).
+    """
+    rows = []
+    for key, new_res in new["results"].items():
+        base_res = base["results"].get(key)
+        if base_res is None:
+            continue
+        ratio = new_res[stat] / base_res[stat]
+        if ratio > 1 + threshold:
+            status = "regressão"
+        elif ratio < 1 - threshold:
+            status = "melhora"
+        else:
+            status = "ok"
+        rows.append((key, base_res[stat], new_res[stat], ratio, status))
+    return rows
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+# ---------- EQUIVALÊNCIA ----------
+# Execuções numba x numpy comparadas por verify
+VERIFY_POP_SIZES = (2, 3, 16, 101)
+VERIFY_SEEDS = (0, 1, 2)
+VERIFY_GENERATIONS = 50
+VERIFY_HISTORIES = ("t", "k", "Q", "best_fit", "mean_fit", "worst_fit", "best_fitness")
+
+def _verify_points(bounds, n, rng):
+    """
+    n pontos em volta de `bounds` (10% além de cada lado, para cair
+    também fora dos limites) mais os cantos exatos.
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    low, high = bounds[:, 0], bounds[:, 1]
+    margin = 0.1 * (high - low)
+    pts = rng.uniform(low - margin, high + margin, size=(n, len(bounds)))
+    corners = np.array(np.meshgrid(*bounds)).reshape(len(bounds), -1).T
+    return np.concatenate([pts, corners])
+
+
+def _identical(scalar, batch):
+    """Bit a bit, como prometem fitness_batch / objective_batch."""
+    mismatches = np.count_nonzero(batch != scalar)
+    return mismatches == 0, f"{mismatches} de {len(scalar)} diferentes"
+
+
+def verify_checks():
+    """(nome, função) de cada verificação; a função devolve (ok, detalhe)."""
+
+    def fitness_placa():
+        pop = _verify_points(placa_plana_ga.PROBLEM.bounds, 2000, np.random.default_rng(0))
+        scalar = np.array([placa_plana_ga.fitness(ind) for ind in pop])
+        return _identical(scalar, placa_plana_ga.fitness_batch(pop))
+
+    def objective_cilindro():
+        pop = _verify_points(CILINDRO_BOUNDS, 2000, np.random.default_rng(0))
+        scalar = np.array([cilindro_ga.objective(ind) for ind in pop])
+        return _identical(scalar, cilindro_ga.objective_batch(pop))
+
+    def fitness_placa_numba():
+        pop = _verify_points(placa_plana_ga.PROBLEM.bounds, 2000, np.random.default_rng(0))
+        same = np.array_equal(fused_fitness(pop, placa_plana_ga.PROBLEM),
+                              placa_plana_ga.fitness_batch(pop))
+        return same, "bit a bit"
+
+    def run_placa_numba():
+        # Históricos completos, idênticos bit a bit
+        diverged = []
+        for pop_size in VERIFY_POP_SIZES:
+            for seed in VERIFY_SEEDS:
+                runs = [placa_plana_ga.run_GA(pop_size=pop_size, generations=VERIFY_GENERATIONS,
+                                              seed=seed, verbose=False, backend=backend)[3]
+                        for backend in ("numpy", "numba")]
+                if not all(np.array_equal(runs[0][name], runs[1][name])
+                           for name in VERIFY_HISTORIES):
+                    diverged.append(f"pop_size={pop_size} seed={seed}")
+        n_runs = len(VERIFY_POP_SIZES) * len(VERIFY_SEEDS)
+        return not diverged, ", ".join(diverged) or f"{n_runs} execuções bit a bit"
+
+    yield "fitness_batch_placa == fitness", fitness_placa
+    yield "objective_batch_cilindro == objective", objective_cilindro
+    if HAVE_NUMBA:
+        yield "fused_fitness == fitness_batch (placa)", fitness_placa_numba
+        yield "run_GA placa numba == numpy", run_placa_numba
+
+
+def verify(log=print):
+    """Roda verify_checks; devolve os nomes das que falharam."""
+    failed = []
+    for name, check in verify_checks():
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok, detail = check()
+        log(f"{name:50s} {'ok' if ok else 'FALHOU'}  ({detail})")
+        if not ok:
+            failed.append(name)
+    return failed
+
+
+# ---------- EXECUÇÃO ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos GAs")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="executa os benchmarks")
+    p_run.add_argument("--out", help="grava o resultado em JSON")
+    p_run.add_argument("--quick", action="store_true", help="grade reduzida")
+    p_run.add_argument("-k", dest="pattern", help="só casos cuja chave contém o texto")
+    p_run.add_argument("--repeat", type=int, default=5)
+    p_run.add_argument("--min-time", type=float, default=0.2)
+
+    p_cmp = sub.add_parser("compare", help="compara dois JSON (base, novo)")
+    p_cmp.add_argument("base")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--threshold", type=float, default=0.10,
+                       help="variação relativa tolerada (0.10 = 10%%)")
+    p_cmp.add_argument("--stat", choices=("min", "median"), default="min")
+
+    sub.add_parser("verify", help="confere versões rápidas x de referência")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        data = run_benchmarks(QUICK_GRID if args.quick else GRID,
+                              args.repeat, args.min_time, args.pattern)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(data, f, indent=2)
+            print(f"Resultados gravados em {args.out}")
+        return 0
+
+    if args.command == "verify":
+        failed = verify()
+        print(f"\n{len(failed)} verificações falharam" if failed else "\nTudo equivalente")
+        return 1 if failed else 0
+
+    rows = compare(_load(args.base), _load(args.new), args.threshold, args.stat)
+    for key, t_base, t_new, ratio, status in rows:
+        print(f"{key:60s} {_fmt_time(t_base)} -> {_fmt_time(t_new)}  x{ratio:5.2f}  {status}")
+    regressions = [row for row in rows if row[4] == "regressão"]
+    print(f"\n{len(rows)} casos comparados, {len(regressions)} regressões "
+          f"(limiar {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# ============================================================
+#  Checkpoint e retomada de execuções longas do GA
+#  - Formato: um .npz (sem compressão, para ser rápido) com a
+#    população, o fitness, a janela de best_hist dos critérios
+#    de parada e os históricos parciais, mais um JSON com a
+#    configuração do modelo, o contador de gerações/avaliações
+#    e o estado do bit generator do RNG
+#  - Escrita atômica: grava num arquivo temporário no mesmo
+#    diretório, faz fsync e troca com os.replace
+#  - resume_GA(path) continua exatamente de onde parou
+# ============================================================
+
+import importlib
+import json
+import os
+import tempfile
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from engine import EngineState
+from history_store import HistoryStore
+
+# Checkpoint carregado do disco
+Checkpoint = namedtuple("Checkpoint", ["state", "config", "histories"])
+
+# Módulo de cada modelo (config["model"])
+MODELS = {"cilindro": "cilindro_ga", "placa": "placa_plana_ga"}
+
+
+def _json_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"não serializável em checkpoint: {type(obj).__name__}")
+
+
+def atomic_savez(path, arrays, prefix=".ckpt-"):
+    """
+    np.savez(arrays) em `path` atomicamente: arquivo temporário no
+    mesmo diretório, fsync e os.replace (um leitor vê o arquivo
+    antigo ou o novo, nunca um pela metade).
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=prefix, suffix=".npz", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def save_checkpoint(path, run, histories=None):
+    """
+    Grava o estado atual de `run` (engine.GARun) e os históricos
+    parciais (dict nome -> sequência) em `path`, atomicamente.
+    Se `histories` for um history_store.HistoryStore, ele só é
+    sincronizado com o disco (os históricos já estão lá).
+    """
+    if isinstance(histories, HistoryStore):
+        histories.flush()
+        histories = None
+
+    state = run.state()
+    meta = {
+        "config": run.config,
+        "generation": state.generation,
+        "evaluations": state.evaluations,
+        "elapsed": state.elapsed,
+        "rng_state": state.rng_state,
+    }
+
+    arrays = {
+        "population": state.population,
+        "fitness": state.fitness,
+        "best_window": np.asarray(state.best_window, dtype=float),
+        "meta": np.array(json.dumps(meta, default=_json_default)),
+    }
+    for name, values in (histories or {}).items():
+        arrays["hist_" + name] = np.asarray(values)
+
+    atomic_savez(path, arrays)
+
+
+def load_checkpoint(path):
+    """Lê um checkpoint gravado por save_checkpoint."""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        histories = {
+            name[len("hist_"):]: data[name]
+            for name in data.files if name.startswith("hist_")
+        }
+        state = EngineState(
+            meta["generation"], data["population"], data["fitness"],
+            meta["rng_state"], data["best_window"].tolist(),
+            meta["evaluations"], meta["elapsed"],
+        )
+    return Checkpoint(state, meta["config"], histories)
+
+
+class Checkpointer:
+    """
+    Decide quando gravar checkpoints durante run_GA.
+
+    path: arquivo .npz (sobrescrito a cada checkpoint).
+    interval: segundos entre checkpoints (None desliga).
+    every: grava a cada `every` gerações (None desliga).
+    """
+
+    def __init__(self, path, interval=5.0, every=None):
+        self.path = path
+        self.interval = interval
+        self.every = every
+        self.saved = 0
+        self._last = time.perf_counter()
+
+    def due(self, generation):
+        if self.every and (generation + 1) % self.every == 0:
+            return True
+        return self.interval is not None and time.perf_counter() - self._last >= self.interval
+
+    def maybe_save(self, run, histories):
+        """Grava se estiver na hora; devolve True se gravou."""
+        if not self.due(run.generation):
+            return False
+        save_checkpoint(self.path, run, histories)
+        self._last = time.perf_counter()
+        self.saved += 1
+        return True
+
+
+def resume_GA(path, **overrides):
+    """
+    Continua a execução salva em `path` com o run_GA do mesmo modelo.
+    `overrides` substitui parâmetros (ex.: generations maior para
+    estender a execução). stop, cache, checkpoint e verbose não são
+    gravados no checkpoint: passe-os de novo aqui se forem usados
+    (idem history_store, reaberto com mode="a").
+    Devolve o mesmo que o run_GA do modelo.
+    """
+    ckpt = load_checkpoint(path)
+    config = dict(ckpt.config)
+    module = importlib.import_module(MODELS[config.pop("model")])
+    config.update(overrides)
+    return module.run_GA(**config, resume=ckpt)
+
+
+# ---------- EXECUÇÃO ----------
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        sys.exit("uso: python checkpoint.py <checkpoint.npz>")
+
+    result = resume_GA(sys.argv[1])
+    if isinstance(result, dict):
+        print(f"Melhor indivíduo: {result['best_individual']}")
+        print(f"Melhor fitness  : {result['best_fitness']:.6g}")
+        print(f"Parada          : {result['stop_reason']}")
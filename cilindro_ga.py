@@ -5,7 +5,13 @@
 # ============================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from engine import GARun
+from history_store import history_arrays, resume_store
+from memetic import make_memetic
+from problems import InsulatedCylinder, as_problem
+from sampling import sample
+from timing import make_timer
 
 # ---------- PARÂMETROS FÍSICOS ----------
 r1 = 0.5          # raio interno [m]
@@ -14,34 +20,244 @@ dT = 180            # diferença de temperatura [°C]
 Q_max = 120.0      # limite máximo de fluxo de calor [W]
 k_max = 0.084      # limite máximo da condutividade [W/m.K]
 
+# Os mesmos parâmetros como problems.InsulatedCylinder (padrão de run_GA).
+# Para outro cenário passe problem= a run_GA / iter_GA / objective.
+PROBLEM = InsulatedCylinder(r1=r1, L=L, dT=dT, Q_max=Q_max, k_max=k_max)
+
 # ---------- FUNÇÃO DE CÁLCULO DO CALOR ----------
-def heat_flow(k, t):
+def heat_flow(k, t, problem=None):
     """
     Fluxo de calor radial em um cilindro com isolamento:
 
     Q = 2 * pi * k * L * dT / ln(r2/r1)
     """
-    r2 = r1 + t
-    return (2 * np.pi * k * L * dT) / np.log(r2 / r1)
+    return (PROBLEM if problem is None else problem).heat_flow(k, t)
 
 # ---------- FUNÇÃO OBJETIVO ----------
-def objective(individual, penalty_factor=1e4):
+def objective(individual, penalty_factor=1e4, problem=None):
 
     k, t = individual
+    p = PROBLEM if problem is None else problem
 
-    Q = heat_flow(k, t)
+    Q = heat_flow(k, t, p)
     fitness = t  # queremos espessura t a menor possível
 
     # Penalidade se Q passar do limite
-    if Q > Q_max:
-        fitness += penalty_factor * (Q - Q_max)**2
+    if Q > p.Q_max:
+        fitness += penalty_factor * np.square(Q - p.Q_max)
 
     # Penalidade se k passar do limite
-    if k > k_max:
-        fitness += penalty_factor * (k - k_max)**2
+    if k > p.k_max:
+        fitness += penalty_factor * np.square(k - p.k_max)
 
     return fitness
 
+# ---------- FUNÇÃO OBJETIVO VETORIZADA ----------
+def objective_batch(population, penalty_factor=1e4, out=None, problem=None):
+    """
+    Versão vetorizada de `objective`: avalia a população inteira
+    (array (pop_size, n_var) com colunas [k, t]) de uma só vez.
+
+    As penalidades são aplicadas por máscara, na mesma ordem da
+    versão escalar (ambas usam np.square, que dá o mesmo resultado
+    para escalar e array), então os valores são idênticos.
+
+    out: buffer opcional (pop_size,) onde o fitness é escrito.
+    problem: None usa PROBLEM.
+    """
+    return (PROBLEM if problem is None else problem).objective(population, penalty_factor, out=out)
+
+# ---------- OPERADORES VETORIZADOS ----------
+#  Todos aceitam dimensões extras à esquerda: uma população
+#  (pop_size, n_var) ou um lote de execuções (n_runs, pop_size, n_var).
+def tournament_indices(fitness, n, rng):
+    """
+    n torneios de 2 indivíduos sorteados de uma vez.
+    fitness: (..., pop_size) -> índices dos vencedores (..., n)
+    (empate -> segundo sorteado).
+    """
+    i1, i2 = rng.integers(0, fitness.shape[-1], size=(2,) + fitness.shape[:-1] + (n,))
+    f1 = np.take_along_axis(fitness, i1, axis=-1)
+    f2 = np.take_along_axis(fitness, i2, axis=-1)
+    return np.where(f1 < f2, i1, i2)
+
+def arithmetic_crossover(parents1, parents2, crossover_rate, rng, out=None):
+    """
+    Crossover aritmético com um alpha por par:
+
+    child1 = alpha * p1 + (1 - alpha) * p2
+    child2 = (1 - alpha) * p1 + alpha * p2
+
+    Pares sem crossover usam alpha = 1, que copia os pais.
+    crossover_rate: escalar ou array broadcastável para (..., n_pairs, 1).
+
+    out: par (child1, child2) de buffers onde os filhos são escritos.
+    child2 pode ter menos linhas que os pais (população de tamanho par,
+    em que o último par só gera um filho).
+    """
+    # Sorteio em bloco: coluna 0 -> alpha, coluna 1 -> faz crossover?
+    u = rng.random(parents1.shape[:-1] + (2,))
+    alpha = np.where(u[..., 1:] < crossover_rate, u[..., :1], 1.0)
+    beta = 1 - alpha
+
+    if out is None:
+        out = (np.empty_like(parents1), np.empty_like(parents2))
+    child1, child2 = out
+
+    np.multiply(alpha, parents1, out=child1)
+    child1 += beta * parents2
+
+    m = child2.shape[-2]
+    np.multiply(beta[..., :m, :], parents1[..., :m, :], out=child2)
+    child2 += alpha[..., :m, :] * parents2[..., :m, :]
+    return child1, child2
+
+def gaussian_mutation(children, bounds, mutation_rate, mutation_scale, rng):
+    """
+    Mutação gaussiana por máscara (cada gene com prob. mutation_rate),
+    desvio mutation_scale * (high - low), seguida de clipping nos limites.
+    mutation_rate e mutation_scale: escalares ou arrays broadcastáveis
+    para (..., n_children, 1). Modifica `children` no lugar.
+    """
+    low, high = np.asarray(bounds, dtype=float).T
+    mask = rng.random(children.shape) < mutation_rate
+    noise = rng.standard_normal(children.shape) * (mutation_scale * (high - low))
+    children += np.where(mask, noise, 0.0)
+    np.clip(children, low, high, out=children)
+    return children
+
+def generation_step(population, fitness, bounds,
+                    crossover_rate, mutation_rate, mutation_scale, rng, out=None,
+                    timer=None):
+    """
+    Gera a próxima população inteira: o melhor indivíduo é mantido
+    (elitismo) e os pop_size - 1 filhos saem de torneios, crossover
+    e mutação feitos em bloco.
+
+    population: (pop_size, n_var) ou (n_runs, pop_size, n_var);
+    fitness com a mesma forma sem o último eixo. No modo empilhado as
+    taxas podem ser escalares ou arrays (n_runs,), uma por execução.
+
+    out: buffer da próxima população (mesma forma); não pode ser
+    o mesmo array de `population`.
+
+    Layout de `out`: [elite, child1 de cada par, child2 de cada par].
+    timer: timing.PhaseTimer opcional (tempo por operador).
+    """
+    pop_size = population.shape[-2]
+    n_children = pop_size - 1
+    n_pairs = (n_children + 1) // 2
+
+    if out is None:
+        out = np.empty_like(population)
+
+    # Taxas por execução -> (..., 1, 1) para broadcast com (..., linhas, genes)
+    crossover_rate = np.asarray(crossover_rate, dtype=float)[..., None, None]
+    mutation_rate = np.asarray(mutation_rate, dtype=float)[..., None, None]
+    mutation_scale = np.asarray(mutation_scale, dtype=float)[..., None, None]
+
+    # Seleção: 2 pais por par
+    winners = tournament_indices(fitness, 2 * n_pairs, rng)[..., None]
+    parents1 = np.take_along_axis(population, winners[..., :n_pairs, :], axis=-2)
+    parents2 = np.take_along_axis(population, winners[..., n_pairs:, :], axis=-2)
+    if timer is not None:
+        timer.lap("selection")
+
+    # Elitismo
+    best = np.argmin(fitness, axis=-1)[..., None, None]
+    out[..., :1, :] = np.take_along_axis(population, best, axis=-2)
+    if timer is not None:
+        timer.lap("assembly")
+
+    # Crossover direto no buffer da próxima geração
+    children = out[..., 1:, :]
+    arithmetic_crossover(
+        parents1, parents2, crossover_rate, rng,
+        out=(children[..., :n_pairs, :], children[..., n_pairs:, :])
+    )
+    if timer is not None:
+        timer.lap("crossover")
+
+    # Mutação
+    gaussian_mutation(children, bounds, mutation_rate, mutation_scale, rng)
+    if timer is not None:
+        timer.lap("mutation")
+    return out
+
+# ---------- ALGORITMO GENÉTICO (ITERADOR) ----------
+def iter_GA(
+    bounds,
+    pop_size=50,
+    generations=100,
+    crossover_rate=0.8,
+    mutation_rate=0.3,
+    mutation_scale=0.3,
+    penalty_factor=None,
+    seed=42,
+    cache=None,
+    stop=None,
+    resume=None,
+    timer=None,
+    problem=None,
+    init="uniform",
+    memetic=None
+):
+    """
+    Mesmos parâmetros de run_GA, mas devolve um iterador (engine.GARun)
+    com um GenerationSnapshot por geração: generation, best_individual
+    ([k, t]), best_fitness, mean_fitness, worst_fitness e best_Q.
+    Ao fim do laço, run.result traz o estado final (RunSummary).
+
+    resume: engine.EngineState de um checkpoint; a população e o RNG
+            vêm dele (seed é ignorada).
+    timer: timing.PhaseTimer opcional.
+    """
+
+    problem = PROBLEM if problem is None else as_problem(problem)
+    memetic = make_memetic(memetic)
+    if bounds is None:
+        bounds = problem.bounds
+
+    rng = np.random.default_rng(seed)
+
+    # População inicial
+    population = None
+    if resume is None:
+        population = sample(pop_size, bounds, rng, init, problem)
+
+    def evaluate(pop, out):
+        return problem.objective(pop, penalty_factor, out=out)
+
+    def step(pop, fit, rng, out):
+        return generation_step(
+            pop, fit, bounds,
+            crossover_rate, mutation_rate, mutation_scale, rng,
+            out=out, timer=timer
+        )
+
+    config = {
+        "model": "cilindro",
+        "problem": problem.to_config(),
+        "bounds": bounds,
+        "pop_size": pop_size,
+        "generations": generations,
+        "crossover_rate": crossover_rate,
+        "mutation_rate": mutation_rate,
+        "mutation_scale": mutation_scale,
+        "penalty_factor": penalty_factor,
+        "init": init,
+        "memetic": None if memetic is None else memetic.to_config(),
+    }
+
+    refine = None
+    if memetic is not None:
+        def refine(generation, pop, fit):
+            return memetic(generation, problem, bounds, pop, fit, penalty_factor)
+
+    return GARun(population, evaluate, step, problem.Q, generations, rng,
+                 cache=cache, stop=stop, config=config, resume=resume, timer=timer,
+                 refine=refine)
+
 # ---------- ALGORITMO GENÉTICO ----------
 def run_GA(
     bounds,
@@ -50,104 +266,209 @@ def run_GA(
     crossover_rate=0.8,
     mutation_rate=0.3,
     mutation_scale=0.3,
-    penalty_factor=1e4,
-    seed=42
+    penalty_factor=None,
+    seed=42,
+    cache=None,
+    stop=None,
+    checkpoint=None,
+    resume=None,
+    history_store=None,
+    timing=None,
+    problem=None,
+    init="uniform",
+    memetic=None
 ):
     """
-    bounds: [(k_min, k_max), (t_min, t_max)]
+    bounds: [(k_min, k_max), (t_min, t_max)]; None usa problem.bounds.
+    penalty_factor: None usa problem.penalty_factor (1e4 no padrão).
+    seed: int, np.random.SeedSequence ou np.random.Generator.
+          Cada execução usa seu próprio gerador (nada do estado
+          global de np.random), então várias execuções no mesmo
+          processo não interferem entre si. Para réplicas
+          independentes use np.random.SeedSequence(s).spawn(n).
+    cache: fitness_cache.FitnessCache opcional; genomas repetidos
+           (elite, valores presos nos limites) não são reavaliados.
+    stop: critério (ou lista) de stopping.py para parar antes de
+          `generations`; os históricos saem cortados na última geração
+          executada e "stop_reason" diz o motivo ("generations" se
+          rodou até o fim).
+    checkpoint: checkpoint.Checkpointer opcional; grava população,
+                fitness, estado do RNG e históricos parciais.
+    resume: checkpoint.Checkpoint carregado (use checkpoint.resume_GA).
+    history_store: history_store.HistoryStore opcional; os históricos
+                   vão direto para arquivos em disco (memória constante)
+                   e saem no resultado como visões np.memmap. Ao retomar,
+                   abra o mesmo diretório com mode="a".
+    timing: True, timing.PhaseTimer ou função hook(registro) para medir
+            o tempo de cada fase por geração; o resumo sai em
+            result["timing"] (None quando desligado).
+    problem: problems.Problem (ou dicionário de to_config()) a otimizar;
+             None usa PROBLEM (os parâmetros físicos deste módulo).
+             Os operadores só dependem de `bounds`, então qualquer
+             modelo roda aqui, ex. problems.ConvectiveCylinder(h=15.0)
+             (genoma na ordem problem.GENES).
+    init: população inicial (sampling.py): "uniform", "lhs", "sobol" ou
+          "feasible" (t perto da fronteira Q = Q_max de `problem`).
+    memetic: True, dicionário ou memetic.Memetic para refinar as elites
+             com passos de Newton / gradiente projetado a cada poucas
+             gerações (as avaliações extras entram em "evaluations").
+
+    Construído sobre iter_GA.
     """
 
-    np.random.seed(seed)
+    timer = make_timer(timing)
+    problem = PROBLEM if problem is None else as_problem(problem)
+
+    histories = {
+        "best_hist": [],
+        "worst_hist": [],
+        "avg_hist": [],
+        # novos históricos para melhor t e melhor Q
+        "best_t_hist": [],
+        "best_Q_hist": [],
+    }
+    if history_store is not None:
+        history_store.set_columns(list(histories))
+        if resume is not None:
+            resume_store(history_store, resume.state.generation + 1)
+        histories = history_store
+    elif resume is not None:
+        for name, values in resume.histories.items():
+            histories[name] = list(values)
+
+    run = iter_GA(
+        bounds, pop_size, generations, crossover_rate, mutation_rate,
+        mutation_scale, penalty_factor, seed, cache=cache, stop=stop,
+        resume=None if resume is None else resume.state, timer=timer,
+        problem=problem, init=init, memetic=memetic
+    )
+    for snap in run:
+        # best, worst, avg, melhor t e Q da geração
+        row = (snap.best_fitness, snap.worst_fitness, snap.mean_fitness,
+               problem.split(snap.best_individual)[1], snap.best_Q)
+        if history_store is None:
+            for values, value in zip(histories.values(), row):
+                values.append(value)
+        else:
+            history_store.append(row)
+
+        if checkpoint is not None:
+            checkpoint.maybe_save(run, histories)
+
+    # Resultado final
+    final = run.result
+
+    return {
+        "best_individual": final.best_individual,
+        "best_fitness": final.best_fitness,
+        **history_arrays(histories),
+        "stop_reason": final.stop_reason,
+        "evaluations": final.evaluations,
+        "timing": None if timer is None else timer.summary(),
+    }
+
+# ---------- VÁRIOS GAs NUM ÚNICO ARRAY ----------
+def run_GA_stacked(
+    bounds,
+    n_runs,
+    pop_size=50,
+    generations=100,
+    crossover_rate=0.8,
+    mutation_rate=0.3,
+    mutation_scale=0.3,
+    penalty_factor=None,
+    seed=42,
+    cache=None,
+    problem=None,
+    init="uniform"
+):
+    """
+    Executa n_runs GAs independentes ao mesmo tempo, com a população
+    empilhada em um array (n_runs, pop_size, n_var). Cada chamada de
+    generation_step avança todas as execuções.
+
+    crossover_rate, mutation_rate, mutation_scale: escalares ou arrays
+    (n_runs,), o que permite varrer hiperparâmetros numa única execução.
+    problem: como em run_GA. Campos com forma (n_runs, 1) dão uma física
+             diferente a cada execução (varredura de cenários, ver
+             sweep.py); nesse caso `cache` não pode ser usado, pois o
+             fitness deixa de depender só do genoma.
+    init: como em run_GA; cada execução recebe a sua amostra (com
+          "feasible", na física do seu cenário).
+
+    Retorna o mesmo dicionário de run_GA, com um eixo (n_runs,) à
+    frente: best_individual (n_runs, n_var), best_hist (n_runs, generations), ...
+    """
+
+    problem = PROBLEM if problem is None else as_problem(problem)
+    if bounds is None:
+        bounds = problem.bounds
+    if cache is not None and problem.scenario_shape != ():
+        raise ValueError("cache não pode ser usado com um problema de vários cenários")
+
+    rng = np.random.default_rng(seed)
+    bounds_arr = np.asarray(bounds, dtype=float)
     n_var = len(bounds)
 
-    # População inicial
-    population = np.zeros((pop_size, n_var))
-    for i in range(n_var):
-        low, high = bounds[i]
-        population[:, i] = np.random.uniform(low, high, size=pop_size)
+    crossover_rate = np.broadcast_to(np.asarray(crossover_rate, dtype=float), (n_runs,))
+    mutation_rate = np.broadcast_to(np.asarray(mutation_rate, dtype=float), (n_runs,))
+    mutation_scale = np.broadcast_to(np.asarray(mutation_scale, dtype=float), (n_runs,))
 
-    def evaluate(pop):
-        return np.array([objective(ind, penalty_factor) for ind in pop])
+    # Buffers pré-alocados (mesmo esquema de run_GA)
+    if init == "uniform":
+        population = rng.uniform(bounds_arr[:, 0], bounds_arr[:, 1],
+                                 size=(n_runs, pop_size, n_var))
+    else:
+        population = sample((n_runs, pop_size), bounds, rng, init, problem)
+    next_population = np.empty_like(population)
+    fitness = np.empty((n_runs, pop_size))
 
-    fitness = evaluate(population)
+    def evaluate(pop):
+        if cache is None:
+            return problem.objective(pop, penalty_factor, out=fitness)
+        return cache.evaluate(pop, lambda rows: problem.objective(rows, penalty_factor), out=fitness)
 
-    best_hist = []
-    worst_hist = []
-    avg_hist = []
+    evaluate(population)
 
-    # novos históricos para melhor t e melhor Q
-    best_t_hist = []
-    best_Q_hist = []
+    runs = np.arange(n_runs)
+    best_hist = np.empty((generations, n_runs))
+    worst_hist = np.empty((generations, n_runs))
+    avg_hist = np.empty((generations, n_runs))
+    best_t_hist = np.empty((generations, n_runs))
+    best_Q_hist = np.empty((generations, n_runs))
 
     for gen in range(generations):
-        new_population = []
-
-        # Estatísticas da geração
-        best_idx = np.argmin(fitness)
-        best_ind = population[best_idx].copy()
-        best_fit = fitness[best_idx]
-
-        best_hist.append(best_fit)
-        worst_hist.append(fitness.max())
-        avg_hist.append(fitness.mean())
-
-        # registra melhor t e Q da geração
-        best_k_gen, best_t_gen = best_ind
-        best_Q_gen = heat_flow(best_k_gen, best_t_gen)
-        best_t_hist.append(best_t_gen)
-        best_Q_hist.append(best_Q_gen)
-
-        # Elitismo: mantém o melhor indivíduo
-        new_population.append(best_ind)
-
-        # Função de seleção por torneio (2 indivíduos)
-        def tournament_selection():
-            i1, i2 = np.random.randint(0, pop_size, size=2)
-            return population[i1] if fitness[i1] < fitness[i2] else population[i2]
-
-        # Gerar o restante da população
-        while len(new_population) < pop_size:
-            parent1 = tournament_selection().copy()
-            parent2 = tournament_selection().copy()
-
-            # Crossover
-            if np.random.rand() < crossover_rate:
-                alpha = np.random.rand()
-                child1 = alpha * parent1 + (1 - alpha) * parent2
-                child2 = (1 - alpha) * parent1 + alpha * parent2
-            else:
-                child1 = parent1.copy()
-                child2 = parent2.copy()
-
-            # Mutação
-            for child in (child1, child2):
-                for i in range(n_var):
-                    if np.random.rand() < mutation_rate:
-                        low, high = bounds[i]
-                        var_range = high - low
-                        child[i] += np.random.normal(0, mutation_scale * var_range)
-                        child[i] = np.clip(child[i], low, high)
-
-                new_population.append(child)
-                if len(new_population) >= pop_size:
-                    break
-
-        population = np.array(new_population)
-        fitness = evaluate(population)
+        # Estatísticas de cada execução
+        best_idx = np.argmin(fitness, axis=1)
+        best_ind = population[runs, best_idx]
 
-    # Resultado final
-    best_idx = np.argmin(fitness)
-    best_ind = population[best_idx]
-    best_fit = fitness[best_idx]
+        best_hist[gen] = fitness[runs, best_idx]
+        worst_hist[gen] = fitness.max(axis=1)
+        avg_hist[gen] = fitness.mean(axis=1)
+
+        # Q com os parâmetros de cada execução: (n_runs, 1, n_var) -> (n_runs, 1)
+        best_t_hist[gen] = problem.split(best_ind)[1]
+        best_Q_hist[gen] = problem.Q(best_ind[:, None, :])[:, 0]
+
+        generation_step(
+            population, fitness, bounds,
+            crossover_rate, mutation_rate, mutation_scale, rng,
+            out=next_population
+        )
+        population, next_population = next_population, population
+        evaluate(population)
+
+    # Resultado final de cada execução
+    best_idx = np.argmin(fitness, axis=1)
 
     return {
-        "best_individual": best_ind,
-        "best_fitness": best_fit,
-        "best_hist": np.array(best_hist),
-        "worst_hist": np.array(worst_hist),
-        "avg_hist": np.array(avg_hist),
-        "best_t_hist": np.array(best_t_hist),
-        "best_Q_hist": np.array(best_Q_hist),
+        "best_individual": population[runs, best_idx].copy(),
+        "best_fitness": fitness[runs, best_idx].copy(),
+        "best_hist": best_hist.T.copy(),
+        "worst_hist": worst_hist.T.copy(),
+        "avg_hist": avg_hist.T.copy(),
+        "best_t_hist": best_t_hist.T.copy(),
+        "best_Q_hist": best_Q_hist.T.copy(),
     }
 
 # ---------- EXECUÇÃO ----------
@@ -155,7 +476,7 @@ if __name__ == "__main__":
     # Variáveis de projeto: [k, t]
     # k de 0.02 até k_max; t de 0.005 m a 0.08 m
     bounds = [
-        (0.02, k_max),
+        (0.02, PROBLEM.k_max),
         (0.005, 0.08)
     ]
 
@@ -168,20 +489,10 @@ if __name__ == "__main__":
     print(f"Melhor k encontrado  : {best_k:.5f} W/m.K")
     print(f"Melhor t encontrado  : {best_t*1000:.3f} mm")
     print(f"Q(k,t)               : {best_Q:.3f} W")
-    print(f"Restrição Q <= {Q_max} W -> {'OK' if best_Q <= Q_max else 'VIOLADA'}")
-
-    generations = np.arange(len(result["best_hist"]))
-
-    # ---------- GRÁFICO 1: melhor, média e pior fitness ----------
-    plt.figure(figsize=(8, 5))
-    plt.plot(generations, result["best_hist"], label="Melhor (mínimo)")
-    plt.plot(generations, result["avg_hist"], label="Média", linestyle="--")
-    plt.plot(generations, result["worst_hist"], label="Pior (máximo)", linestyle=":")
-    plt.xlabel("Geração")
-    plt.ylabel("Fitness")
-    plt.title("GA – melhor e pior fitness")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    print(f"Restrição Q <= {PROBLEM.Q_max} W -> {'OK' if best_Q <= PROBLEM.Q_max else 'VIOLADA'}")
+
+    # ---------- GRÁFICOS (arquivos PNG, sem janela) ----------
+    from reporting import render_report
 
+    for path in render_report(result, "resultados", name="cilindro", Q_max=PROBLEM.Q_max):
+        print(f"Gráfico salvo em {path}")
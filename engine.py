@@ -0,0 +1,219 @@
+# ============================================================
+#  Laço de gerações comum aos dois GAs
+#  - GARun é um iterador: a cada geração devolve um retrato
+#    leve (GenerationSnapshot) da população avaliada
+#  - cilindro_ga.iter_GA / placa_plana_ga.iter_GA montam as
+#    funções do modelo e criam o GARun; run_GA consome o
+#    iterador e monta os históricos
+#  - GARun.state() expõe o estado completo entre duas gerações
+#    (população, fitness, RNG, ...) para checkpoints
+#  - Com um timing.PhaseTimer, o laço mede avaliação e
+#    bookkeeping (o step mede seleção/crossover/mutação)
+#  - refine(generation, pop, fitness) opcional roda logo depois
+#    de cada avaliação (busca local de memetic.py)
+# ============================================================
+
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+from stopping import check_stop
+
+# Retrato de uma geração (estatísticas da população antes da variação)
+GenerationSnapshot = namedtuple(
+    "GenerationSnapshot",
+    ["generation", "best_individual", "best_fitness",
+     "mean_fitness", "worst_fitness", "best_Q"],
+)
+
+# Estado final de uma execução
+RunSummary = namedtuple(
+    "RunSummary",
+    ["best_individual", "best_fitness", "population", "fitness",
+     "generations", "stop_reason", "evaluations"],
+)
+
+# Estado do motor logo depois de um GenerationSnapshot
+EngineState = namedtuple(
+    "EngineState",
+    ["generation", "population", "fitness", "rng_state",
+     "best_window", "evaluations", "elapsed"],
+)
+
+
+def _history_window(stop):
+    """Quantos valores de best_hist os critérios de parada precisam."""
+    if stop is None:
+        return 1
+    if callable(stop):
+        stop = (stop,)
+    return max((getattr(criterion, "window", 0) for criterion in stop), default=0) + 1
+
+
+def restore_rng(rng_state):
+    """Gerador com o mesmo bit generator e estado de `rng_state`."""
+    bit_generator = getattr(np.random, rng_state["bit_generator"])()
+    bit_generator.state = rng_state
+    return np.random.Generator(bit_generator)
+
+
+class GARun:
+    """
+    Laço principal do GA como iterador.
+
+        run = iter_GA(...)
+        for snap in run:
+            ...
+        run.result   # RunSummary, disponível quando o laço termina
+
+    population: população inicial; o array passa a ser um dos dois
+                buffers do motor (não reutilize fora daqui).
+    evaluate(pop, out): fitness de `pop` (em `out` se não for None).
+    step(pop, fitness, rng, out): escreve a próxima população em `out`.
+    heat_Q(ind): fluxo de calor Q do indivíduo (para o retrato).
+    cache: fitness_cache.FitnessCache opcional.
+    stop: critério(s) de stopping.py. `best_hist` passado a eles
+          guarda só os últimos window + 1 valores.
+    config: parâmetros do modelo, guardados junto dos checkpoints.
+    resume: EngineState de onde continuar (ver checkpoint.py); nesse
+            caso `population` é ignorada.
+    timer: timing.PhaseTimer opcional. O tempo entre um yield e a volta
+           ao laço (históricos, checkpoints do consumidor) conta como
+           bookkeeping.
+    refine(generation, pop, fitness): busca local opcional depois de
+            cada avaliação; altera pop e fitness no lugar e devolve
+            quantas avaliações gastou (ver memetic.Memetic).
+
+    Parar de iterar (break) simplesmente abandona a execução.
+    """
+
+    def __init__(self, population, evaluate, step, heat_Q, generations, rng,
+                 cache=None, stop=None, config=None, resume=None, timer=None,
+                 refine=None):
+        self.evaluate = evaluate
+        self.step = step
+        self.heat_Q = heat_Q
+        self.generations = generations
+        self.rng = rng
+        self.cache = cache
+        self.stop = stop
+        self.config = config or {}
+        self.timer = timer
+        self.refine = refine
+        self.result = None
+
+        self._best_hist = deque(maxlen=_history_window(stop))
+        self._resume = resume
+        if resume is None:
+            self.population = population
+            self.fitness = np.empty(population.shape[:-1])
+            self.generation = 0
+            self.evaluations = 0
+            self._elapsed0 = 0.0
+        else:
+            self.population = np.array(resume.population, dtype=float)
+            self.fitness = np.array(resume.fitness, dtype=float)
+            self.generation = resume.generation
+            self.evaluations = resume.evaluations
+            self._elapsed0 = resume.elapsed
+            self._best_hist.extend(resume.best_window)
+            self.rng = restore_rng(resume.rng_state)
+        self._start = None
+
+    def _score(self, pop):
+        if self.cache is None:
+            self.evaluations += len(pop)
+            return self.evaluate(pop, self.fitness)
+        misses = self.cache.misses
+        self.cache.evaluate(pop, lambda rows: self.evaluate(rows, None), out=self.fitness)
+        self.evaluations += self.cache.misses - misses
+        return self.fitness
+
+    def _refine(self):
+        if self.refine is None:
+            return
+        self.evaluations += self.refine(self.generation, self.population, self.fitness)
+        if self.timer is not None:
+            self.timer.lap("refinement")
+
+    def elapsed(self):
+        if self._start is None:
+            return self._elapsed0
+        return self._elapsed0 + time.perf_counter() - self._start
+
+    def state(self):
+        """
+        Estado completo do motor no ponto atual (entre o retrato de
+        `generation` e a variação seguinte). Os arrays são os buffers
+        internos: copie-os se forem guardados além da próxima geração.
+        """
+        return EngineState(
+            self.generation, self.population, self.fitness,
+            self.rng.bit_generator.state, list(self._best_hist),
+            self.evaluations, self.elapsed(),
+        )
+
+    def __iter__(self):
+        self._start = time.perf_counter()
+        timer = self.timer
+        if timer is not None:
+            timer.start(self.evaluations)
+
+        # Buffer da próxima população (trocado com a atual a cada geração)
+        next_population = np.empty_like(self.population)
+
+        # Ao retomar, o retrato da geração salva já foi entregue
+        skip_snapshot = self._resume is not None
+        if not skip_snapshot:
+            self._score(self.population)
+            if timer is not None:
+                timer.lap("evaluation")
+            self._refine()
+
+        stop_reason = "generations"
+        while self.generation < self.generations:
+            fitness = self.fitness
+            if not skip_snapshot:
+                # Estatísticas da geração
+                best_idx = np.argmin(fitness)
+                best_ind = self.population[best_idx].copy()
+                best_fit = fitness[best_idx]
+                self._best_hist.append(best_fit)
+
+                yield GenerationSnapshot(
+                    self.generation, best_ind, best_fit,
+                    fitness.mean(), fitness.max(), self.heat_Q(best_ind)
+                )
+            skip_snapshot = False
+
+            # Critérios de parada antecipada
+            reason = check_stop(
+                self.stop, generation=self.generation, best_hist=self._best_hist,
+                fitness=fitness, evaluations=self.evaluations, elapsed=self.elapsed()
+            )
+            self.generation += 1
+            if timer is not None:
+                timer.lap("bookkeeping")
+            if reason:
+                stop_reason = reason
+                if timer is not None:
+                    timer.end_generation(self.generation - 1, self.evaluations)
+                break
+
+            # Nova geração inteira de uma vez (elitismo + filhos)
+            self.step(self.population, fitness, self.rng, next_population)
+            self.population, next_population = next_population, self.population
+            self._score(self.population)
+            if timer is not None:
+                timer.lap("evaluation")
+            self._refine()
+            if timer is not None:
+                timer.end_generation(self.generation - 1, self.evaluations)
+
+        best_idx = np.argmin(self.fitness)
+        self.result = RunSummary(
+            self.population[best_idx].copy(), self.fitness[best_idx],
+            self.population, self.fitness,
+            self.generation, stop_reason, self.evaluations,
+        )
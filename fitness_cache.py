@@ -0,0 +1,99 @@
+# ============================================================
+#  Cache de fitness (memoização) com despejo LRU
+#  - Chave = bytes do genoma (ou do genoma quantizado)
+#  - Duplicatas dentro da população e elites que passam de
+#    geração em geração não são reavaliadas
+#  - Contadores de acertos (hits) e faltas (misses)
+# ============================================================
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    """
+    Cache LRU de fitness por genoma.
+
+    maxsize: número máximo de genomas guardados (None = sem limite).
+    quantum: passo de quantização das chaves. None usa os bytes exatos
+             do genoma; um escalar ou vetor (n_var,) arredonda cada gene
+             para a grade `round(x / quantum)`, e genomas na mesma célula
+             compartilham o fitness do primeiro avaliado.
+
+    Use um cache por função de fitness (mesmo modelo e penalty_factor):
+    a chave não inclui a função.
+    """
+
+    def __init__(self, maxsize=100_000, quantum=None):
+        self.maxsize = maxsize
+        self.quantum = None if quantum is None else np.asarray(quantum, dtype=float)
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _keys(self, rows):
+        if self.quantum is not None:
+            rows = np.round(rows / self.quantum).astype(np.int64)
+        rows = np.ascontiguousarray(rows)
+        # Cada linha vira um único elemento "void" -> comparável e hasheável
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[-1]))).ravel()
+
+    def evaluate(self, population, fn, out=None):
+        """
+        Fitness de `population` (..., n_var) usando o cache.
+        fn(rows) recebe só os genomas ainda não vistos, (m, n_var),
+        e devolve (m,) fitness — em uma única chamada.
+        """
+        n_var = population.shape[-1]
+        rows = population.reshape(-1, n_var)
+        keys = self._keys(rows)
+
+        # Genomas repetidos na própria população contam como hits
+        uniq, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        values = np.empty(len(uniq))
+        missing = []
+
+        data = self._data
+        for j, key in enumerate(uniq):
+            key = key.tobytes()
+            value = data.get(key)
+            if value is None:
+                missing.append(j)
+            else:
+                data.move_to_end(key)
+                values[j] = value
+
+        if missing:
+            missing = np.asarray(missing)
+            values[missing] = fn(rows[first[missing]])
+            for j in missing:
+                data[uniq[j].tobytes()] = values[j]
+            if self.maxsize is not None:
+                while len(data) > self.maxsize:
+                    data.popitem(last=False)
+
+        self.misses += len(missing)
+        self.hits += len(rows) - len(missing)
+
+        result = values[inverse.ravel()].reshape(population.shape[:-1])
+        if out is None:
+            return result
+        out[...] = result
+        return out
@@ -0,0 +1,176 @@
+# ============================================================
+#  Histórico colunar em disco para execuções muito longas
+#  - Uma coluna por arquivo binário float64, mapeada com
+#    np.memmap e aumentada em blocos de `chunk` linhas
+#  - O número de linhas válidas fica em length.i64 (8 bytes,
+#    atualizado depois dos dados): outro processo pode abrir
+#    HistoryReader e ler as colunas sem cópia com a execução
+#    ainda em andamento
+#  - Memória constante: só as páginas tocadas ficam residentes
+# ============================================================
+
+import json
+import os
+
+import numpy as np
+
+_META = "meta.json"
+_LENGTH = "length.i64"
+
+
+def _column_file(path, name):
+    return os.path.join(path, name + ".f64")
+
+
+class HistoryStore:
+    """
+    Gravador append-only de históricos por geração.
+
+    path: diretório do histórico (criado se não existir).
+    columns: nomes das colunas; se None, são definidos pelo primeiro
+             usuário (ex.: run_GA) com set_columns ou lidos de um
+             histórico já existente.
+    chunk: quantas linhas o arquivo cresce de cada vez.
+    mode: "w" recomeça do zero; "a" continua um histórico existente.
+    """
+
+    def __init__(self, path, columns=None, chunk=65536, mode="w"):
+        if mode not in ("w", "a"):
+            raise ValueError("mode deve ser 'w' ou 'a'")
+        self.path = os.fspath(path)
+        self.chunk = int(chunk)
+        self.columns = None
+        self._maps = []
+        self._capacity = 0
+        os.makedirs(self.path, exist_ok=True)
+
+        meta_path = os.path.join(self.path, _META)
+        existing = None
+        if mode == "a" and os.path.exists(meta_path):
+            with open(meta_path) as f:
+                existing = json.load(f)["columns"]
+
+        self._length = self._open_length(reset=existing is None)
+        if existing is not None:
+            if columns is not None and list(columns) != existing:
+                raise ValueError(f"colunas {list(columns)} != colunas gravadas {existing}")
+            self._open_columns(existing)
+        elif columns is not None:
+            self.set_columns(columns)
+
+    def _open_length(self, reset):
+        length_path = os.path.join(self.path, _LENGTH)
+        if reset or not os.path.exists(length_path):
+            with open(length_path, "wb") as f:
+                f.write(np.zeros(1, dtype=np.int64).tobytes())
+        return np.memmap(length_path, dtype=np.int64, mode="r+", shape=(1,))
+
+    def _open_columns(self, columns):
+        self.columns = list(columns)
+        n = len(self)
+        self._capacity = max(self.chunk, -(-n // self.chunk) * self.chunk)
+        self._maps = [self._map(name, self._capacity) for name in self.columns]
+
+    def _map(self, name, capacity):
+        fname = _column_file(self.path, name)
+        mode = "r+b" if os.path.exists(fname) else "w+b"
+        with open(fname, mode) as f:
+            f.truncate(capacity * 8)
+        return np.memmap(fname, dtype=np.float64, mode="r+", shape=(capacity,))
+
+    def set_columns(self, columns):
+        """Define as colunas de um histórico novo (vazio)."""
+        if self.columns is not None:
+            if list(columns) != self.columns:
+                raise ValueError(f"colunas {list(columns)} != colunas gravadas {self.columns}")
+            return
+        self._length[0] = 0
+        with open(os.path.join(self.path, _META), "w") as f:
+            json.dump({"columns": list(columns), "dtype": "float64"}, f)
+        for name in columns:
+            fname = _column_file(self.path, name)
+            if os.path.exists(fname):
+                os.remove(fname)
+        self._open_columns(columns)
+
+    def __len__(self):
+        return int(self._length[0])
+
+    def _grow(self):
+        for m in self._maps:
+            m.flush()
+        self._capacity += self.chunk
+        self._maps = [self._map(name, self._capacity) for name in self.columns]
+
+    def append(self, row):
+        """Acrescenta uma linha (valores na ordem de `columns`)."""
+        n = len(self)
+        if n == self._capacity:
+            self._grow()
+        for m, value in zip(self._maps, row):
+            m[n] = value
+        # O comprimento só avança depois dos dados (leitores nunca veem lixo)
+        self._length[0] = n + 1
+
+    def truncate(self, n):
+        """Descarta as linhas a partir de `n` (ex.: ao retomar um checkpoint)."""
+        if n < len(self):
+            self._length[0] = n
+
+    def column(self, name):
+        """Visão (sem cópia) das linhas válidas da coluna."""
+        return self._maps[self.columns.index(name)][:len(self)]
+
+    def as_dict(self):
+        return {name: self.column(name) for name in self.columns}
+
+    def flush(self):
+        for m in self._maps:
+            m.flush()
+        self._length.flush()
+
+
+class HistoryReader:
+    """
+    Leitura (somente leitura, sem cópia) de um HistoryStore, inclusive
+    de outro processo enquanto a execução grava.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, _META)) as f:
+            self.columns = json.load(f)["columns"]
+        self._length = np.memmap(os.path.join(self.path, _LENGTH), dtype=np.int64,
+                                 mode="r", shape=(1,))
+
+    def __len__(self):
+        return int(self._length[0])
+
+    def column(self, name):
+        if name not in self.columns:
+            raise KeyError(name)
+        n = len(self)
+        if n == 0:
+            return np.empty(0)
+        return np.memmap(_column_file(self.path, name), dtype=np.float64, mode="r", shape=(n,))
+
+    def as_dict(self):
+        return {name: self.column(name) for name in self.columns}
+
+
+# ---------- USO EM run_GA ----------
+def resume_store(store, length):
+    """Corta `store` nas `length` linhas de um checkpoint ao retomar."""
+    if len(store) < length:
+        raise ValueError(
+            f"histórico em {store.path} tem {len(store)} linhas; "
+            f"o checkpoint precisa de {length}"
+        )
+    store.truncate(length)
+
+
+def history_arrays(histories):
+    """Históricos como arrays (dict de listas) ou visões np.memmap (HistoryStore)."""
+    if isinstance(histories, HistoryStore):
+        return histories.as_dict()
+    return {name: np.array(values) for name, values in histories.items()}
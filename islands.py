@@ -0,0 +1,290 @@
+# ============================================================
+#  Modelo de ilhas para populações grandes
+#  - Cada processo evolui a sua subpopulação com os operadores
+#    de cilindro_ga / placa_plana_ga (generation_step)
+#  - A cada `migration_interval` gerações as ilhas trocam os
+#    melhores indivíduos por buffers multiprocessing.shared_memory
+#    (nada de cópias serializadas com pickle)
+#  - Topologias: "ring" (i recebe de i-1) e "full" (recebe os
+#    melhores entre todas as outras ilhas)
+# ============================================================
+
+import multiprocessing as mp
+import queue
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+TOPOLOGIES = ("ring", "full")
+
+
+# ---------- MOTORES POR MODELO ----------
+def _make_engine(model, ga_kwargs):
+    """
+    Retorna (n_var, init, evaluate, step, heat_Q) para o modelo escolhido:
+    - init(pop_size, rng) -> população
+    - evaluate(pop, out) -> fitness em `out`
+    - step(pop, fit, rng, out) -> próxima população em `out`
+    - heat_Q(ind) -> Q do indivíduo
+    """
+    if model == "cilindro":
+        import cilindro_ga as m
+        from problems import as_problem
+        from sampling import sample
+
+        problem = ga_kwargs.get("problem")
+        problem = m.PROBLEM if problem is None else as_problem(problem)
+        bounds = ga_kwargs.get("bounds")
+        bounds = np.asarray(problem.bounds if bounds is None else bounds, dtype=float)
+        cr = ga_kwargs.get("crossover_rate", 0.8)
+        mr = ga_kwargs.get("mutation_rate", 0.3)
+        ms = ga_kwargs.get("mutation_scale", 0.3)
+        pf = ga_kwargs.get("penalty_factor")
+
+        method = ga_kwargs.get("init", "uniform")
+
+        def init(pop_size, rng):
+            if method == "uniform":
+                return rng.uniform(bounds[:, 0], bounds[:, 1], size=(pop_size, len(bounds)))
+            return sample(pop_size, bounds, rng, method, problem)
+
+        def evaluate(pop, out):
+            return problem.objective(pop, pf, out=out)
+
+        def step(pop, fit, rng, out):
+            return m.generation_step(pop, fit, bounds, cr, mr, ms, rng, out=out)
+
+        return len(bounds), init, evaluate, step, problem.Q
+
+    if model == "placa":
+        import placa_plana_ga as m
+        from problems import as_problem
+
+        problem = ga_kwargs.get("problem")
+        problem = m.PROBLEM if problem is None else as_problem(problem)
+        pf = ga_kwargs.get("penalty_factor", 1e6)
+        step_kwargs = {key: ga_kwargs[key] for key in ("pc", "pm", "k_tour", "sigma_t", "sigma_k")
+                       if key in ga_kwargs}
+
+        def init(pop_size, rng):
+            return m.init_population(pop_size, rng=rng, method=ga_kwargs.get("init", "uniform"),
+                                     problem=problem)
+
+        def evaluate(pop, out):
+            return m.fitness_batch(pop, pf, out=out, problem=problem)
+
+        def step(pop, fit, rng, out):
+            return m.generation_step(pop, fit, rng, out=out, problem=problem, **step_kwargs)
+
+        def heat_Q(ind):
+            return problem.heat_flow(ind[1], ind[0])
+
+        return 2, init, evaluate, step, heat_Q
+
+    raise ValueError(f"modelo desconhecido: {model!r} (use 'cilindro' ou 'placa')")
+
+
+def _sources(island, n_islands, topology):
+    """Ilhas das quais `island` recebe migrantes."""
+    if topology == "ring":
+        return [(island - 1) % n_islands]
+    return [j for j in range(n_islands) if j != island]
+
+
+# ---------- PROCESSO DE CADA ILHA ----------
+def _island_worker(island, n_islands, model, ga_kwargs, pop_size, generations,
+                   migration_interval, n_migrants, topology, seed,
+                   shm_names, barrier, results):
+    shm_pop = shm_fit = None
+    try:
+        n_var, init, evaluate, step, heat_Q = _make_engine(model, ga_kwargs)
+        rng = np.random.default_rng(seed)
+
+        # Buffers compartilhados: um "cais" de migrantes por ilha
+        shm_pop = shared_memory.SharedMemory(name=shm_names[0])
+        shm_fit = shared_memory.SharedMemory(name=shm_names[1])
+        dock = np.ndarray((n_islands, n_migrants, n_var), dtype=np.float64, buffer=shm_pop.buf)
+        dock_fit = np.ndarray((n_islands, n_migrants), dtype=np.float64, buffer=shm_fit.buf)
+
+        population = init(pop_size, rng)
+        next_population = np.empty_like(population)
+        fitness = np.empty(pop_size)
+        evaluate(population, fitness)
+
+        best_hist = np.empty(generations)
+        worst_hist = np.empty(generations)
+        avg_hist = np.empty(generations)
+        sources = _sources(island, n_islands, topology)
+
+        for gen in range(generations):
+            best_hist[gen] = fitness.min()
+            worst_hist[gen] = fitness.max()
+            avg_hist[gen] = fitness.mean()
+
+            step(population, fitness, rng, next_population)
+            population, next_population = next_population, population
+            evaluate(population, fitness)
+
+            # Migração: publica a elite, espera todos, recebe e substitui os piores
+            if n_migrants and (gen + 1) % migration_interval == 0 and gen + 1 < generations:
+                elite = np.argsort(fitness)[:n_migrants]
+                dock[island] = population[elite]
+                dock_fit[island] = fitness[elite]
+                barrier.wait()
+
+                incoming = dock[sources].reshape(-1, n_var)
+                incoming_fit = dock_fit[sources].reshape(-1)
+                chosen = np.argsort(incoming_fit)[:n_migrants]
+
+                worst = np.argsort(fitness)[-n_migrants:]
+                population[worst] = incoming[chosen]
+                fitness[worst] = incoming_fit[chosen]
+
+                # Ninguém escreve no cais antes de todos terem lido
+                barrier.wait()
+
+        best_idx = np.argmin(fitness)
+        results.put((island, {
+            "best_individual": population[best_idx].copy(),
+            "best_fitness": fitness[best_idx],
+            "best_Q": heat_Q(population[best_idx]),
+            "best_hist": best_hist,
+            "worst_hist": worst_hist,
+            "avg_hist": avg_hist,
+        }))
+    except BaseException as exc:
+        # Libera as outras ilhas presas na barreira
+        barrier.abort()
+        results.put((island, exc))
+    finally:
+        for shm in (shm_pop, shm_fit):
+            if shm is not None:
+                shm.close()
+
+
+# ---------- EXECUÇÃO DO ARQUIPÉLAGO ----------
+def run_islands(
+    model="cilindro",
+    n_islands=None,
+    pop_size=1000,
+    generations=100,
+    migration_interval=10,
+    n_migrants=2,
+    topology="ring",
+    seed=0,
+    **ga_kwargs
+):
+    """
+    Evolui n_islands subpopulações de `pop_size` indivíduos, uma por
+    processo, com migração de elites a cada `migration_interval` gerações.
+
+    model: "cilindro" (kwargs de cilindro_ga.run_GA: bounds, crossover_rate,
+           mutation_rate, mutation_scale, penalty_factor, problem, init) ou
+           "placa" (kwargs de placa_plana_ga.run_GA: pc, pm, k_tour,
+           sigma_t, sigma_k, penalty_factor, problem, init).
+    topology: "ring" ou "full".
+    seed: cada ilha recebe um fluxo independente (SeedSequence.spawn).
+
+    Retorna o melhor indivíduo global e históricos combinados
+    (melhor = mínimo entre ilhas, média = média das médias,
+    pior = máximo entre ilhas), mais o resultado de cada ilha em "islands".
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"topologia desconhecida: {topology!r} (use {TOPOLOGIES})")
+    if n_islands is None:
+        n_islands = mp.cpu_count()
+    if not 0 <= n_migrants <= pop_size - 1:
+        raise ValueError("n_migrants deve estar entre 0 e pop_size - 1")
+    if migration_interval < 1:
+        raise ValueError("migration_interval deve ser >= 1")
+
+    n_var = _make_engine(model, ga_kwargs)[0]
+    seeds = np.random.SeedSequence(seed).spawn(n_islands)
+
+    shm_pop = shared_memory.SharedMemory(create=True, size=max(1, n_islands * n_migrants * n_var * 8))
+    shm_fit = shared_memory.SharedMemory(create=True, size=max(1, n_islands * n_migrants * 8))
+    ctx = mp.get_context()
+    barrier = ctx.Barrier(n_islands)
+    results = ctx.Queue()
+    procs = []
+    try:
+        for island in range(n_islands):
+            proc = ctx.Process(
+                target=_island_worker,
+                args=(island, n_islands, model, ga_kwargs, pop_size, generations,
+                      migration_interval, n_migrants, topology, seeds[island],
+                      (shm_pop.name, shm_fit.name), barrier, results),
+            )
+            proc.start()
+            procs.append(proc)
+
+        per_island = [None] * n_islands
+        errors = []
+        reported = set()
+        while len(reported) < n_islands:
+            try:
+                island, payload = results.get(timeout=1.0)
+            except queue.Empty:
+                # Processo morto sem resposta (ex.: falta de memória):
+                # quebra a barreira para as outras ilhas não ficarem presas
+                dead = [i for i, p in enumerate(procs)
+                        if i not in reported and p.exitcode not in (None, 0)]
+                if dead:
+                    barrier.abort()
+                    for i in dead:
+                        reported.add(i)
+                        errors.append((i, RuntimeError(f"exitcode {procs[i].exitcode}")))
+                continue
+            reported.add(island)
+            if isinstance(payload, BaseException):
+                errors.append((island, payload))
+            else:
+                per_island[island] = payload
+        for proc in procs:
+            proc.join()
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        shm_pop.close()
+        shm_pop.unlink()
+        shm_fit.close()
+        shm_fit.unlink()
+
+    # A primeira falha "real" (as outras ilhas só viram a barreira quebrada)
+    if errors:
+        errors.sort(key=lambda e: isinstance(e[1], BrokenBarrierError))
+        island, exc = errors[0]
+        raise RuntimeError(f"ilha {island} falhou: {exc!r}") from exc
+
+    best = min(per_island, key=lambda r: r["best_fitness"])
+    return {
+        "best_individual": best["best_individual"],
+        "best_fitness": best["best_fitness"],
+        "best_Q": best["best_Q"],
+        "best_hist": np.min([r["best_hist"] for r in per_island], axis=0),
+        "worst_hist": np.max([r["worst_hist"] for r in per_island], axis=0),
+        "avg_hist": np.mean([r["avg_hist"] for r in per_island], axis=0),
+        "islands": per_island,
+    }
+
+
+# ---------- EXECUÇÃO ----------
+if __name__ == "__main__":
+    result = run_islands(
+        model="placa",
+        n_islands=4,
+        pop_size=2000,
+        generations=100,
+        migration_interval=10,
+        n_migrants=5,
+        topology="ring",
+    )
+
+    t_best, k_best = result["best_individual"]
+    print("==== Resultado do modelo de ilhas ====")
+    print(f"Espessura ótima t*  : {t_best*1000:.3f} mm")
+    print(f"Condutividade k*    : {k_best:.5f} W/m.K")
+    print(f"Q(t*,k*)            : {result['best_Q']:.3f} W")
+    print(f"Melhor fitness      : {result['best_fitness']:.6g}")
@@ -0,0 +1,182 @@
+# ============================================================
+#  Kernels compilados (Numba) opcionais para placa_plana_ga
+#  - Com populações pequenas (pop_size=16) o custo de cada
+#    chamada NumPy domina; aqui a geração inteira vira dois
+#    laços compilados:
+#      _variation: torneio, elitismo, crossover, mutação e
+#                  clipping numa só passada
+#      _fitness  : heat_flow, normalização, limites e penalidade
+#  - Mesma sequência do RNG que a versão NumPy: os números
+#    aleatórios são sorteados antes, em bloco, com as mesmas
+#    chamadas e formas de generation_step; os kernels só os
+#    consomem. Resultado idêntico bit a bit.
+#  - O log fica no NumPy (uma chamada por geração): o log
+#    vetorizado do NumPy (SIMD) e o da libm usado pelo Numba
+#    diferem no último bit em ~0,1% dos valores
+#  - Numba só é importado no primeiro uso dos kernels (load_kernels):
+#    importar este módulo não custa os ~250 ms do import do numba.
+#    HAVE_NUMBA diz se ele está instalado, sem importá-lo
+#  - backend="auto" só escolhe Numba quando compensa: kernels já
+#    carregados ou execução longa o bastante para pagar a carga
+#    (~0,5 s lendo do cache); sem Numba instalado usa o NumPy
+# ============================================================
+
+import importlib.util
+
+import numpy as np
+
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+BACKENDS = ("auto", "numpy", "numba")
+
+# Estimativa grosseira para "auto" (medida com pop_size 16 a 4096):
+# import do numba + carga dos kernels do cache ~0,5 s; ganho por
+# geração ~90 us fixos + ~0,12 us por indivíduo
+LOAD_COST = 0.5
+SAVING_PER_GENERATION = 90e-6
+SAVING_PER_INDIVIDUAL = 0.12e-6
+
+_KERNELS = None
+
+
+def resolve_backend(backend, pop_size=None, generations=None, timer=None):
+    """
+    "auto" -> "numba" se instalado e se compensa, senão "numpy".
+
+    pop_size, generations: tamanho da execução; com os dois, "auto"
+        só carrega os kernels se o ganho estimado passar de LOAD_COST
+        (None = desconhecido, trata como grande).
+    timer: com um PhaseTimer ativo "auto" fica no NumPy, que mede
+        seleção, crossover e mutação separadamente.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend desconhecido: {backend!r} (use {', '.join(BACKENDS)})")
+    if backend == "auto":
+        if not HAVE_NUMBA or timer is not None:
+            return "numpy"
+        if _KERNELS is not None or pop_size is None or generations is None:
+            return "numba"
+        saving = generations * (SAVING_PER_GENERATION + SAVING_PER_INDIVIDUAL * pop_size)
+        return "numba" if saving > LOAD_COST else "numpy"
+    if backend == "numba" and not HAVE_NUMBA:
+        raise ImportError("backend='numba' precisa do pacote numba (pip install numba)")
+    return backend
+
+
+# ---------- KERNELS ----------
+def _variation(pop, fitnesses, idxs, u, mask_u, noise, pc, pm, low, high, out):
+    """
+    Mesma conta de placa_plana_ga.generation_step, elemento a elemento.
+    idxs: torneios (2 n_pairs, k_tour); u: (n_pairs, 2) do crossover;
+    mask_u, noise: (pop_size - 1, n_var) da mutação (noise já * sigma).
+    """
+    pop_size, n_var = pop.shape
+    n_children = pop_size - 1
+    n_pairs = (n_children + 1) // 2
+    n_second = n_children - n_pairs
+
+    # Elitismo (primeiro mínimo, como np.argmin)
+    best = 0
+    for i in range(1, pop_size):
+        if fitnesses[i] < fitnesses[best]:
+            best = i
+    for g in range(n_var):
+        out[0, g] = pop[best, g]
+
+    for p in range(n_pairs):
+        # Torneios dos dois pais
+        w1 = idxs[p, 0]
+        w2 = idxs[n_pairs + p, 0]
+        for j in range(1, idxs.shape[1]):
+            if fitnesses[idxs[p, j]] < fitnesses[w1]:
+                w1 = idxs[p, j]
+            if fitnesses[idxs[n_pairs + p, j]] < fitnesses[w2]:
+                w2 = idxs[n_pairs + p, j]
+
+        # Crossover aritmético (alpha = 1 -> cópia dos pais)
+        alpha = u[p, 0] if u[p, 1] < pc else 1.0
+        beta = 1 - alpha
+        for g in range(n_var):
+            out[1 + p, g] = alpha * pop[w1, g] + beta * pop[w2, g]
+            if p < n_second:
+                out[1 + n_pairs + p, g] = alpha * pop[w2, g] + beta * pop[w1, g]
+
+    # Mutação gaussiana + clipping
+    for i in range(n_children):
+        for g in range(n_var):
+            x = out[1 + i, g] + (noise[i, g] if mask_u[i, g] < pm else 0.0)
+            out[1 + i, g] = min(max(x, low[g]), high[g])
+    return out
+
+
+def _fitness(pop, log_ratio, r_i, h, c, Q_max, t_min, t_max, k_min, k_max, pf, out):
+    """Mesma conta de ConvectiveCylinder.objective, linha a linha."""
+    for i in range(pop.shape[0]):
+        t = pop[i, 0]
+        k = pop[i, 1]
+        if not (t_min <= t <= t_max and k_min <= k <= k_max):
+            out[i] = 1e9
+            continue
+        r_o = r_i + t
+        Q = c / (log_ratio[i] / k + 1.0 / (h * r_o))
+        penalty = 0.0
+        if Q > Q_max:
+            d = Q - Q_max
+            penalty = d * d * pf
+        out[i] = (t - t_min) / (t_max - t_min) + (k - k_min) / (k_max - k_min) + penalty
+    return out
+
+
+def load_kernels():
+    """
+    Importa o numba, compila (ou lê do cache em disco) e roda uma vez
+    os kernels num problema mínimo, para que a primeira geração de
+    verdade não pague isso. Chamadas seguintes não custam nada.
+    """
+    global _KERNELS
+    if _KERNELS is None:
+        import numba
+
+        variation = numba.njit(cache=True)(_variation)
+        fitness = numba.njit(cache=True)(_fitness)
+
+        pop = np.array([[0.05, 0.06], [0.10, 0.07], [0.15, 0.08]])
+        fit = np.zeros(3)
+        one = np.ones(2)
+        variation(pop, fit, np.zeros((2, 2), dtype=np.int64), np.zeros((1, 2)),
+                  np.ones((2, 2)), np.zeros((2, 2)), 0.5, 0.5, -one, one,
+                  np.empty_like(pop))
+        fitness(pop, fit, 0.1, 1.0, 1.0, 1.0, 0.0, 1.0, 0.0, 1.0, 1.0, fit)
+        _KERNELS = variation, fitness
+    return _KERNELS
+
+
+# ---------- INTERFACE ----------
+def fused_step(pop, fitnesses, rng, out, low, high, pc=0.9, pm=0.1, k_tour=3,
+               sigma_t=0.005, sigma_k=0.002):
+    """
+    Equivalente a placa_plana_ga.generation_step (mesmos sorteios, na
+    mesma ordem, e mesmo resultado), com a variação num só kernel.
+    """
+    variation, _ = load_kernels()
+    pop_size, n_var = pop.shape
+    n_children = pop_size - 1
+    n_pairs = (n_children + 1) // 2
+
+    idxs = rng.integers(0, pop_size, size=(2 * n_pairs, k_tour))
+    u = rng.random((n_pairs, 2))
+    mask_u = rng.random((n_children, n_var))
+    noise = rng.standard_normal((n_children, n_var)) * np.array([sigma_t, sigma_k])
+    return variation(pop, fitnesses, idxs, u, mask_u, noise, pc, pm, low, high, out)
+
+
+def fused_fitness(pop, problem, penalty_factor=None, out=None):
+    """Equivalente a problem.objective (ConvectiveCylinder, genoma [t, k])."""
+    _, fitness = load_kernels()
+    p = problem
+    pf = p.penalty_factor if penalty_factor is None else penalty_factor
+    if out is None:
+        out = np.empty(len(pop))
+    log_ratio = np.log((p.r_i + pop[:, 0]) / p.r_i)
+    c = 2.0 * np.pi * p.L * p.dT
+    return fitness(pop, log_ratio, p.r_i, p.h, c, p.Q_max,
+                   p.t_min, p.t_max, p.k_min, p.k_max, float(pf), out)
@@ -0,0 +1,161 @@
+# ============================================================
+#  Modo memético: busca local nos melhores indivíduos
+#  - A cada `every` gerações, os `top` melhores da população
+#    avaliada recebem alguns passos determinísticos, todos de
+#    uma vez (arrays (top,)), com as derivadas analíticas de
+#    Problem.heat_flow_grad:
+#      1. Newton em t até o ponto estacionário do fitness
+#         penalizado, base + pf (Q - Q_max)², ou seja
+#             Q(k, t) = Q_max + (d base/dt) / (2 pf |dQ/dt|)
+#         (quase em cima da fronteira Q = Q_max)
+#      2. gradiente projetado em k ao longo da fronteira:
+#             dφ/dk = d base/dk + d base/dt * dt/dk,
+#             dt/dk = -(dQ/dk) / (dQ/dt)
+#         com passos 1, 1/2, 1/4, ... da largura da caixa,
+#         projetados nos limites; cada candidato volta à
+#         fronteira pelo passo 1 e fica o de menor fitness
+#  - Só substitui um indivíduo se o fitness melhorar: a busca
+#    local nunca piora a população
+#  - Não consome números aleatórios: com o mesmo seed, o GA
+#    continua reprodutível (e retomável de checkpoints)
+# ============================================================
+
+import numpy as np
+
+from problems import as_problem
+
+
+class Memetic:
+    """
+    Refinamento local periódico das elites.
+
+    top: quantos dos melhores indivíduos refinar.
+    every: a cada quantas gerações (0, every, 2*every, ...).
+    iterations: ciclos (passo em t + passo em k) por refinamento.
+    newton_steps: iterações de Newton em t por passo.
+    line_steps: tamanhos de passo testados em k (1, 1/2, ..., da caixa).
+    """
+
+    def __init__(self, top=4, every=5, iterations=2, newton_steps=6, line_steps=8):
+        self.top = top
+        self.every = every
+        self.iterations = iterations
+        self.newton_steps = newton_steps
+        self.line_steps = line_steps
+
+    def to_config(self):
+        return {"top": self.top, "every": self.every, "iterations": self.iterations,
+                "newton_steps": self.newton_steps, "line_steps": self.line_steps}
+
+    def __call__(self, generation, problem, bounds, population, fitness, penalty_factor=None):
+        """
+        Refina as elites de `population` (pop_size, n_var) no lugar,
+        atualizando `fitness`. Retorna o número de avaliações gastas.
+        """
+        if self.every <= 0 or generation % self.every:
+            return 0
+        top = min(self.top, len(fitness))
+        if top < len(fitness):
+            idx = np.argpartition(fitness, top - 1)[:top]
+        else:
+            idx = np.arange(len(fitness))
+
+        genomes, evaluations = refine(
+            problem, bounds, population[idx], penalty_factor,
+            self.iterations, self.newton_steps, self.line_steps
+        )
+        new_fitness = problem.objective(genomes, penalty_factor)
+        evaluations += top
+
+        better = new_fitness < fitness[idx]
+        population[idx[better]] = genomes[better]
+        fitness[idx[better]] = new_fitness[better]
+        return evaluations
+
+
+def make_memetic(memetic):
+    """
+    Normaliza o parâmetro `memetic` de run_GA: None/False -> None,
+    True -> Memetic(), dict (de to_config) -> Memetic(**dict),
+    Memetic -> ele mesmo.
+    """
+    if memetic is None or memetic is False:
+        return None
+    if memetic is True:
+        return Memetic()
+    if isinstance(memetic, Memetic):
+        return memetic
+    if isinstance(memetic, dict):
+        return Memetic(**memetic)
+    raise TypeError(f"memetic inválido: {memetic!r}")
+
+
+# ---------- PASSOS LOCAIS ----------
+def settle_t(problem, k, t, t_bounds, penalty_factor=None, newton_steps=6):
+    """
+    Newton em t (k fixo) até dQ/dt * [Q - Q_max - b_t / (2 pf |dQ/dt|)] = 0,
+    o mínimo do fitness penalizado na direção t; projetado em t_bounds.
+    Onde dQ/dt >= 0 (antes do raio crítico) t não se move.
+    """
+    pf = problem.penalty_factor if penalty_factor is None else penalty_factor
+    _, b_t = problem.base_gradient()
+    t_low, t_high = t_bounds
+    for _ in range(newton_steps):
+        Q, _, Q_t = problem.heat_flow_grad(k, t)
+        descending = Q_t < 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            target = problem.Q_max + b_t / (2 * pf * np.abs(Q_t))
+            t_new = t - (Q - target) / Q_t
+        t = np.where(descending, np.clip(t_new, t_low, t_high), t)
+    return t
+
+
+def boundary_gradient(problem, k, t):
+    """dφ/dk do fitness ao longo da fronteira Q = Q_max (t = t_b(k))."""
+    b_k, b_t = problem.base_gradient()
+    _, Q_k, Q_t = problem.heat_flow_grad(k, t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dt_dk = np.where(Q_t < 0, -Q_k / Q_t, 0.0)
+    return b_k + b_t * dt_dk
+
+
+def refine(problem, bounds, genomes, penalty_factor=None, iterations=2,
+           newton_steps=6, line_steps=8):
+    """
+    Versão refinada de `genomes` (N, n_var), sem alterar o original.
+    Genes além de k e t ficam como estão.
+    Retorna (genomas, avaliações do fitness gastas na busca em linha).
+    """
+    problem = as_problem(problem)
+    i_k, i_t = problem.GENES.index("k"), problem.GENES.index("t")
+    k_low, k_high = bounds[i_k]
+    t_bounds = bounds[i_t]
+
+    genomes = np.array(genomes, dtype=float)
+    k, t = genomes[:, i_k], genomes[:, i_t]
+    n = len(genomes)
+
+    # Passos 0, 1, 1/2, ... da largura da caixa em k: (N, line_steps + 1)
+    steps = np.concatenate(([0.0], 0.5 ** np.arange(line_steps))) * (k_high - k_low)
+    candidates = np.repeat(genomes[:, None, :], len(steps), axis=1)
+
+    evaluations = 0
+    for _ in range(iterations):
+        t = settle_t(problem, k, t, t_bounds, penalty_factor, newton_steps)
+        direction = -np.sign(boundary_gradient(problem, k, t))
+
+        k_try = np.clip(k[:, None] + direction[:, None] * steps, k_low, k_high)
+        t_try = settle_t(problem, k_try, np.broadcast_to(t[:, None], k_try.shape),
+                         t_bounds, penalty_factor, newton_steps)
+        candidates[..., i_k] = k_try
+        candidates[..., i_t] = t_try
+        fit = problem.objective(candidates, penalty_factor)
+        evaluations += fit.size
+
+        choice = np.argmin(fit, axis=1)
+        k = k_try[np.arange(n), choice]
+        t = t_try[np.arange(n), choice]
+
+    genomes[:, i_k] = k
+    genomes[:, i_t] = t
+    return genomes, evaluations
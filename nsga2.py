@@ -0,0 +1,263 @@
+# ============================================================
+#  NSGA-II para o problema de placa_plana_ga
+#  - Em vez de t_norm + k_norm + penalidade, minimiza ao mesmo
+#    tempo (t, k, Q) e devolve a frente de Pareto inteira numa
+#    execução (sem uma execução por ponderação)
+#  - Restrição Q <= Q_max por dominância restrita (Deb): viável
+#    vence inviável; entre inviáveis, menor violação vence
+#  - Ordenação não dominada (ENS-BS) e distância de multidão
+#    ficam em pareto.py
+#  - Reaproveita os operadores em lote de placa_plana_ga e o
+#    laço de engine.GARun: o "fitness" do motor é a chave de
+#    comparação por multidão, frente + 0.5/(1 + distância), e o
+#    step faz a sobrevivência (mu + lambda) de pais + filhos; a
+#    chave dos sobreviventes sai dessa mesma ordenação (uma só
+#    ordenação não dominada por geração)
+# ============================================================
+
+import numpy as np
+
+import placa_plana_ga as placa
+from engine import GARun
+from history_store import history_arrays
+from pareto import (OBJECTIVES, constrained_sort, crowded_key, crowding_distance, key_rank,
+                    non_dominated_sort)
+from problems import as_problem
+from timing import make_timer
+
+
+# ---------- OBJETIVOS ----------
+def objective_values(pop, objectives=OBJECTIVES, problem=None):
+    """
+    Matriz (pop_size, len(objectives)) a minimizar, genoma [t, k].
+    Um "-" na frente do nome maximiza (a coluna sai com sinal trocado),
+    ex. "-k": material de k maior (mais barato).
+    problem: None usa placa_plana_ga.PROBLEM.
+    """
+    problem = placa.PROBLEM if problem is None else problem
+    k, t = problem.split(pop)
+    columns = {"t": t, "k": k, "Q": problem.heat_flow(k, t)}
+    return np.stack([-columns[name[1:]] if name.startswith("-") else columns[name]
+                     for name in objectives], axis=-1)
+
+
+def violation(pop, problem=None):
+    """Quanto Q passa de Q_max (0 nos viáveis)."""
+    problem = placa.PROBLEM if problem is None else problem
+    return np.maximum(problem.Q(pop) - problem.Q_max, 0.0)
+
+
+# ---------- FRENTES ----------
+def rank_population(pop, objectives=OBJECTIVES, constrained=True, problem=None):
+    """(objetivos, frente, distância, chave) de uma população [t, k]."""
+    F = objective_values(pop, objectives, problem)
+    if constrained:
+        rank = constrained_sort(F, violation(pop, problem))
+    else:
+        rank = non_dominated_sort(F)
+    crowd = crowding_distance(F, rank)
+    return F, rank, crowd, crowded_key(rank, crowd)
+
+
+# ---------- VARIAÇÃO E SOBREVIVÊNCIA ----------
+def offspring(pop, key, rng, out, pc=0.9, pm=0.1, k_tour=2,
+              sigma_t=0.005, sigma_k=0.002, timer=None, problem=None):
+    """len(out) filhos por torneio na chave, crossover e mutação em bloco."""
+    n_pairs = (len(out) + 1) // 2
+    winners = placa.tournament_selection_batch(key, 2 * n_pairs, k_tour=k_tour, rng=rng)
+    if timer is not None:
+        timer.lap("selection")
+
+    placa.crossover_batch(
+        pop[winners[:n_pairs]], pop[winners[n_pairs:]], pc=pc,
+        out=(out[:n_pairs], out[n_pairs:]), rng=rng
+    )
+    if timer is not None:
+        timer.lap("crossover")
+
+    placa.mutate_batch(out, pm=pm, sigma_t=sigma_t, sigma_k=sigma_k, out=out, rng=rng,
+                       problem=problem)
+    if timer is not None:
+        timer.lap("mutation")
+    return out
+
+
+def survivors(combined, n, objectives=OBJECTIVES, constrained=True, problem=None):
+    """
+    Índices dos n melhores de `combined` (frentes inteiras + multidão) e
+    a chave de cada um na ordenação conjunta, usada direto na próxima
+    seleção (como no NSGA-II original: não é preciso reordenar os n).
+    """
+    _, _, _, key = rank_population(combined, objectives, constrained, problem)
+    keep = np.argsort(key, kind="stable")[:n]
+    return keep, key[keep]
+
+
+# ---------- LAÇO ----------
+def iter_NSGA2(
+    pop_size=100,
+    generations=100,
+    pc=0.9,
+    pm=0.1,
+    k_tour=2,
+    sigma_t=0.005,
+    sigma_k=0.002,
+    seed=None,
+    objectives=OBJECTIVES,
+    constrained=True,
+    stop=None,
+    timer=None,
+    init="uniform",
+    problem=None
+):
+    """
+    Iterador (engine.GARun) do NSGA-II. best_fitness dos retratos é a
+    menor chave de multidão (frente = pareto.key_rank da chave);
+    evaluations conta os filhos avaliados.
+    """
+    problem = placa.PROBLEM if problem is None else as_problem(problem)
+    rng = np.random.default_rng(seed)
+    pop = placa.init_population(pop_size, rng=rng, method=init, problem=problem)
+    combined = np.empty((2 * pop_size, pop.shape[1]))
+    # Chave dos sobreviventes do último passo (população, chave): evita
+    # ordenar de novo a população que acabou de sair de survivors
+    ranked = [None, None]
+
+    def evaluate(pop, out):
+        if ranked[0] is pop:
+            key = ranked[1]
+            ranked[:] = None, None
+        else:
+            _, _, _, key = rank_population(pop, objectives, constrained, problem)
+        if out is None:
+            return key
+        out[:] = key
+        return out
+
+    def step(pop, key, rng, out):
+        combined[:pop_size] = pop
+        offspring(pop, key, rng, combined[pop_size:], pc=pc, pm=pm, k_tour=k_tour,
+                  sigma_t=sigma_t, sigma_k=sigma_k, timer=timer, problem=problem)
+        keep, ranked[1] = survivors(combined, pop_size, objectives, constrained, problem)
+        np.take(combined, keep, axis=0, out=out)
+        ranked[0] = out
+        if timer is not None:
+            timer.lap("assembly")
+        return out
+
+    def best_Q(ind):
+        return problem.heat_flow(ind[1], ind[0])
+
+    config = {
+        "model": "nsga2",
+        "pop_size": pop_size,
+        "generations": generations,
+        "pc": pc,
+        "pm": pm,
+        "k_tour": k_tour,
+        "sigma_t": sigma_t,
+        "sigma_k": sigma_k,
+        "objectives": list(objectives),
+        "constrained": constrained,
+        "init": init,
+        "problem": problem.to_config(),
+    }
+    return GARun(pop, evaluate, step, best_Q, generations, rng,
+                 stop=stop, config=config, timer=timer)
+
+
+def run_NSGA2(
+    pop_size=100,
+    generations=100,
+    pc=0.9,
+    pm=0.1,
+    k_tour=2,
+    sigma_t=0.005,
+    sigma_k=0.002,
+    seed=None,
+    objectives=OBJECTIVES,
+    constrained=True,
+    stop=None,
+    timing=None,
+    init="uniform",
+    archive=None,
+    problem=None
+):
+    """
+    Frente de Pareto de (t, k, Q) do problema de placa_plana_ga
+    numa única execução.
+
+    objectives: subconjunto/ordem de ("t", "k", "Q") a minimizar; "-k"
+                maximiza k. No modelo atual k menor reduz Q sem custo, então
+                com OBJECTIVES a frente fica em k = k_min (curva t x Q);
+                ("t", "-k", "Q") troca espessura por material mais barato.
+    constrained: aplica Q <= Q_max por dominância restrita; com False
+                 a frente cobre também os pontos com Q > Q_max.
+    stop, timing, init: como em placa_plana_ga.run_GA.
+    archive: archive.ParetoArchive opcional (com names == objectives);
+             recebe a frente (viável) de cada geração, então guarda
+             também projetos que a população perdeu pelo caminho.
+    problem: problems.ConvectiveCylinder (ou dicionário de to_config());
+             None usa placa_plana_ga.PROBLEM.
+
+    Retorna um dicionário com:
+        "front"           : genomas [t, k] distintos da frente (ordenados por t)
+        "front_objectives": objetivos da frente, colunas em `objectives`
+        "front_Q"         : Q de cada ponto da frente
+        "population", "objectives", "rank", "crowding": população final
+        "front_size_hist" : tamanho da frente (viável) por geração
+        "generations", "stop_reason", "evaluations", "timing"
+    """
+    problem = placa.PROBLEM if problem is None else as_problem(problem)
+    timer = make_timer(timing)
+    hist = {"front_size_hist": []}
+    if archive is not None and tuple(archive.names) != tuple(objectives):
+        raise ValueError(f"arquivo com objetivos {archive.names}, execução com {tuple(objectives)}")
+
+    run = iter_NSGA2(pop_size, generations, pc, pm, k_tour, sigma_t, sigma_k, seed,
+                     objectives, constrained, stop=stop, timer=timer, init=init,
+                     problem=problem)
+    for snap in run:
+        in_front = key_rank(run.fitness) == 0
+        if constrained:
+            in_front &= violation(run.population, problem) <= 0
+        hist["front_size_hist"].append(np.count_nonzero(in_front))
+        if archive is not None:
+            front = run.population[in_front]
+            archive.add(objective_values(front, objectives, problem), front)
+
+    final = run.result
+    F, rank, crowd, _ = rank_population(final.population, objectives, constrained, problem)
+    in_front = rank == 0
+    if constrained:
+        in_front &= violation(final.population, problem) <= 0
+
+    # np.unique ordena por t (depois k) e remove genomas repetidos
+    front, first = np.unique(final.population[in_front], axis=0, return_index=True)
+    return {
+        "front": front,
+        "front_objectives": F[in_front][first],
+        "front_Q": problem.Q(front),
+        "population": final.population,
+        "objectives": F,
+        "rank": rank,
+        "crowding": crowd,
+        **history_arrays(hist),
+        "generations": final.generations,
+        "stop_reason": final.stop_reason,
+        "evaluations": final.evaluations,
+        "timing": None if timer is None else timer.summary(),
+    }
+
+
+# ---------- EXECUÇÃO ----------
+if __name__ == "__main__":
+    res = run_NSGA2(pop_size=100, generations=200, seed=0, objectives=("t", "-k", "Q"))
+    front = res["front"]
+
+    print(f"Frente de Pareto: {len(front)} projetos viáveis "
+          f"({res['evaluations']} avaliações)")
+    print("   t [mm]   k [W/m.K]     Q [W]")
+    for i in np.linspace(0, len(front) - 1, min(len(front), 12)).astype(int):
+        t, k = front[i]
+        print(f"{t*1000:9.2f} {k:11.5f} {res['front_Q'][i]:9.2f}")
@@ -0,0 +1,158 @@
+# ============================================================
+#  Ordenação de Pareto (só NumPy, sem importar os modelos)
+#  - Frentes não dominadas ENS-BS (Zhang et al., 2015): ordem
+#    lexicográfica + busca binária sobre as frentes, comparação
+#    com cada frente vetorizada
+#  - Dominância restrita (Deb): viável vence inviável; entre
+#    inviáveis, menor violação vence
+#  - Distância de multidão de todas as frentes de uma vez
+#    (lexsort por (frente, objetivo)) e a chave escalar da
+#    comparação por multidão
+#  - 2 objetivos: varredura O(N log N); 3 ou mais: O(M N^2) no
+#    pior caso (uma frente só)
+#  - Usado por nsga2.py e archive.py
+# ============================================================
+
+import numpy as np
+
+# Objetivos padrão (colunas de nsga2.objective_values)
+OBJECTIVES = ("t", "k", "Q")
+
+
+# ---------- ORDENAÇÃO NÃO DOMINADA ----------
+def _dominates_any(front, f):
+    """Algum ponto de `front` (n, M) domina f?"""
+    return np.any(np.all(front <= f, axis=1) & np.any(front < f, axis=1))
+
+
+def non_dominated_sort(F):
+    """
+    Índice da frente (0 = não dominados) de cada linha de F (N, M),
+    minimização. ENS-BS: em ordem lexicográfica nenhum ponto é
+    dominado por um posterior, então cada ponto entra na primeira
+    frente que não o domina, achada por busca binária.
+
+    Custo: M = 2 -> O(N log N) (_sort_2d: basta o último ponto de
+    cada frente); M >= 3 -> cada teste compara com a frente inteira,
+    O(M N^2) no pior caso (todos numa frente só; 20k pontos ~10 s).
+    """
+    F = np.asarray(F, dtype=float)
+    n = len(F)
+    rank = np.empty(n, dtype=np.intp)
+    order = np.lexsort(F.T[::-1])
+    if F.shape[1] == 2:
+        return _sort_2d(F, order, rank)
+
+    # Cada frente: buffer (capacidade dobrada quando enche) + tamanho
+    buffers, sizes = [], []
+    for i in order:
+        f = F[i]
+        lo, hi = 0, len(buffers)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _dominates_any(buffers[mid][:sizes[mid]], f):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(buffers):
+            buffers.append(np.empty((8, F.shape[1])))
+            sizes.append(0)
+        if sizes[lo] == len(buffers[lo]):
+            buffers[lo] = np.concatenate([buffers[lo], np.empty_like(buffers[lo])])
+        buffers[lo][sizes[lo]] = f
+        sizes[lo] += 1
+        rank[i] = lo
+    return rank
+
+
+def _sort_2d(F, order, rank):
+    """
+    Varredura para 2 objetivos. Em ordem lexicográfica, f2 não cresce
+    dentro de uma frente, então o último ponto L de cada frente tem o
+    menor f2 e a frente domina f se e só se L domina f: L2 < f2, ou
+    L2 == f2 com L1 < f1 (L1 <= f1 vale sempre pela ordem).
+    """
+    points = F.tolist()
+    last = []                      # último ponto (f1, f2) de cada frente
+    for i in order.tolist():
+        f1, f2 = points[i]
+        lo, hi = 0, len(last)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            g1, g2 = last[mid]
+            if g2 < f2 or (g2 == f2 and g1 < f1):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(last):
+            last.append((f1, f2))
+        else:
+            last[lo] = (f1, f2)
+        rank[i] = lo
+    return rank
+
+
+def constrained_sort(F, violation):
+    """
+    Frentes com dominância restrita: os viáveis (violation == 0)
+    ordenados por non_dominated_sort; os inviáveis depois deles,
+    uma frente por valor de violação (crescente).
+    """
+    rank = np.empty(len(F), dtype=np.intp)
+    feasible = violation <= 0
+    n_fronts = 0
+    if feasible.any():
+        rank[feasible] = non_dominated_sort(F[feasible])
+        n_fronts = rank[feasible].max() + 1
+    if not feasible.all():
+        _, dense = np.unique(violation[~feasible], return_inverse=True)
+        rank[~feasible] = n_fronts + dense.ravel()
+    return rank
+
+
+# ---------- DISTÂNCIA DE MULTIDÃO ----------
+def crowding_distance(F, rank):
+    """
+    Distância de multidão de cada linha dentro da sua frente:
+    soma, por objetivo, da distância entre os vizinhos dividida pela
+    amplitude da frente; extremos de cada frente valem inf.
+    """
+    F = np.asarray(F, dtype=float)
+    n = len(F)
+    crowd = np.zeros(n)
+    if n == 0:
+        return crowd
+    for j in range(F.shape[1]):
+        order = np.lexsort((F[:, j], rank))
+        f = F[order, j]
+        r = rank[order]
+
+        change = r[1:] != r[:-1]
+        first = np.concatenate(([True], change))
+        last = np.concatenate((change, [True]))
+        starts = np.flatnonzero(first)
+        ends = np.flatnonzero(last)
+        span = np.repeat(f[ends] - f[starts], ends - starts + 1)
+
+        gap = np.zeros(n)
+        gap[1:-1] = f[2:] - f[:-2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d = np.where(span > 0, gap / span, 0.0)
+        d[first | last] = np.inf
+        crowd[order] += d
+    return crowd
+
+
+def crowded_key(rank, crowd):
+    """
+    Chave escalar da comparação por multidão (menor é melhor):
+    frente primeiro, depois maior distância. A parte fracionária fica
+    em [0, 0.5] (inf -> 0, distância 0 -> 0.5), sempre abaixo do
+    próximo inteiro: nenhum ponto empata com a frente seguinte.
+    """
+    return rank + 0.5 / (1.0 + crowd)
+
+
+def key_rank(key):
+    """Frente de cada chave de crowded_key (exata: floor da chave)."""
+    return np.floor(key).astype(np.intp)
@@ -1,5 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt   # <--- IMPORT PARA GRÁFICOS
+
+from engine import GARun
+from history_store import history_arrays, resume_store
+from kernels import fused_fitness, fused_step, load_kernels, resolve_backend
+from memetic import make_memetic
+from problems import ConvectiveCylinder, as_problem
+from sampling import sample
+from timing import make_timer
 
 # ============================================
 #  PARÂMETROS FÍSICOS DO PROBLEMA
@@ -20,15 +27,21 @@ Q_max = 120.0     # [W]
 t_min, t_max = 0.025, 0.200   # [m] 25 mm a 200 mm
 k_min, k_max = 0.050, 0.084   # [W/m.K] (intervalo típico de materiais isolantes)
 
+# Os mesmos parâmetros como problems.ConvectiveCylinder: o cenário padrão
+# (problem=None). Para outro cenário passe problem= a run_GA / iter_GA
+# (e às funções abaixo), ex.
+#     run_GA(problem=dataclasses.replace(PROBLEM, Q_max=100.0))
+PROBLEM = ConvectiveCylinder(r_i=r_i, L=L, T_i=T_i, T_inf=T_inf, h=h, Q_max=Q_max,
+                             t_min=t_min, t_max=t_max, k_min=k_min, k_max=k_max)
+
 
 # ============================================
 #  FUNÇÃO DE CÁLCULO DO CALOR (Eq. 1)
 #  Q = 2π L ΔT / [ ln(r_o/r_i)/k + 1/(h r_o) ]
 # ============================================
-def heat_flow(k, t):
-    r_o = r_i + t
-    denom = np.log(r_o / r_i) / k + 1.0 / (h * r_o)
-    return 2.0 * np.pi * L * dT / denom
+def heat_flow(k, t, problem=None):
+    problem = PROBLEM if problem is None else problem
+    return problem.heat_flow(k, t)
 
 
 # ============================================
@@ -37,77 +50,303 @@ def heat_flow(k, t):
 #  - Mas Q(k,t) <= Q_max
 #  -> multiobjetivo simplificado: minimizar t_norm + k_norm
 # ============================================
-def fitness(individual, penalty_factor=1e6):
+def fitness(individual, penalty_factor=1e6, problem=None):
     t, k = individual
+    p = PROBLEM if problem is None else problem
 
     # Repara limites (se fugir, fitness bem ruim)
-    if not (t_min <= t <= t_max) or not (k_min <= k <= k_max):
+    if not (p.t_min <= t <= p.t_max) or not (p.k_min <= k <= p.k_max):
         return 1e9
 
-    Q = heat_flow(k, t)
+    Q = heat_flow(k, t, p)
 
     # Normalização simples de t e k para 0–1
-    t_norm = (t - t_min) / (t_max - t_min)
-    k_norm = (k - k_min) / (k_max - k_min)
+    t_norm = (t - p.t_min) / (p.t_max - p.t_min)
+    k_norm = (k - p.k_min) / (p.k_max - p.k_min)
 
     base_obj = t_norm + k_norm  # quanto menor, melhor (camada fina + material bom)
 
     # Penaliza se ultrapassar Q_max
-    if Q > Q_max:
-        penalty = (Q - Q_max)**2 * penalty_factor
+    if Q > p.Q_max:
+        penalty = np.square(Q - p.Q_max) * penalty_factor
     else:
         penalty = 0.0
 
     return base_obj + penalty
 
 
+# ============================================
+#  FUNÇÃO DE FITNESS VETORIZADA
+#  - Mesma regra de `fitness`, mas para a população inteira
+#  - Limites, normalização e penalidade feitos com máscaras
+# ============================================
+def fitness_batch(pop, penalty_factor=1e6, out=None, problem=None):
+    """
+    Avalia todas as linhas [t, k] de `pop` de uma vez.
+    Retorna exatamente os mesmos valores que `fitness` aplicada
+    indivíduo por indivíduo.
+
+    out: buffer opcional onde o fitness é escrito.
+    problem: problems.ConvectiveCylinder (None -> PROBLEM).
+    """
+    problem = PROBLEM if problem is None else problem
+    return problem.objective(pop, penalty_factor, out=out)
+
+
 # ============================================
 #  OPERADORES DO GA
 # ============================================
-def init_population(pop_size):
+def init_population(pop_size, rng=None, method="uniform", problem=None):
     """
     Cromossomo: [t, k]
+    rng: np.random.Generator, SeedSequence ou semente (None -> aleatório)
+    method: "uniform", "lhs", "sobol" ou "feasible" (t entre a espessura
+            mínima com Q <= Q_max e t_max; ver sampling.py)
     """
-    pop = np.zeros((pop_size, 2))
-    pop[:, 0] = np.random.uniform(t_min, t_max, size=pop_size)  # t
-    pop[:, 1] = np.random.uniform(k_min, k_max, size=pop_size)  # k
-    return pop
+    rng = np.random.default_rng(rng)
+    problem = PROBLEM if problem is None else problem
+    return sample(pop_size, problem.bounds, rng, method, problem)
 
-def tournament_selection(pop, fitnesses, k_tour=3):
-    idxs = np.random.randint(0, len(pop), size=k_tour)
+def tournament_selection(pop, fitnesses, k_tour=3, rng=None):
+    rng = np.random.default_rng(rng)
+    idxs = rng.integers(0, len(pop), size=k_tour)
     best_idx = idxs[np.argmin(fitnesses[idxs])]
     return pop[best_idx].copy()
 
-def crossover(parent1, parent2, pc=0.9):
+def crossover(parent1, parent2, pc=0.9, rng=None):
     """
     Crossover aritmético em cada gene (t e k)
     """
+    rng = np.random.default_rng(rng)
     c1, c2 = parent1.copy(), parent2.copy()
-    if np.random.rand() < pc:
-        alpha = np.random.rand()
+    if rng.random() < pc:
+        alpha = rng.random()
         c1 = alpha * parent1 + (1 - alpha) * parent2
         c2 = alpha * parent2 + (1 - alpha) * parent1
     return c1, c2
 
-def mutate(individual, pm=0.1, sigma_t=0.005, sigma_k=0.002):
+def mutate(individual, pm=0.1, sigma_t=0.005, sigma_k=0.002, rng=None, problem=None):
     """
     Mutação gaussiana em t e k
     """
+    rng = np.random.default_rng(rng)
     t, k = individual
 
-    if np.random.rand() < pm:
-        t += np.random.normal(0, sigma_t)
-    if np.random.rand() < pm:
-        k += np.random.normal(0, sigma_k)
+    if rng.random() < pm:
+        t += rng.normal(0, sigma_t)
+    if rng.random() < pm:
+        k += rng.normal(0, sigma_k)
 
     # Garante dentro dos limites
-    t = np.clip(t, t_min, t_max)
-    k = np.clip(k, k_min, k_max)
+    (t_low, t_high), (k_low, k_high) = (PROBLEM if problem is None else problem).bounds
+    t = np.clip(t, t_low, t_high)
+    k = np.clip(k, k_low, k_high)
 
     individual[0], individual[1] = t, k
     return individual
 
 
+# ============================================
+#  OPERADORES EM LOTE (POPULAÇÃO INTEIRA)
+#  - Mesma lógica dos operadores acima, mas com
+#    vetores de índices e matrizes de pais/filhos
+# ============================================
+def tournament_selection_batch(fitnesses, n, k_tour=3, rng=None):
+    """
+    n torneios de k_tour indivíduos de uma vez.
+    Retorna os índices dos vencedores.
+    """
+    rng = np.random.default_rng(rng)
+    idxs = rng.integers(0, len(fitnesses), size=(n, k_tour))
+    winners = np.argmin(fitnesses[idxs], axis=1)
+    return idxs[np.arange(n), winners]
+
+def crossover_batch(parents1, parents2, pc=0.9, out=None, rng=None):
+    """
+    Crossover aritmético com um alpha por par.
+    Pares sem crossover (prob. 1 - pc) recebem alpha = 1,
+    que devolve cópias exatas dos pais.
+
+    out: par (c1, c2) de buffers para os filhos; c2 pode ter
+    menos linhas que os pais (último par gera só um filho).
+    """
+    rng = np.random.default_rng(rng)
+
+    # Sorteio em bloco: coluna 0 -> alpha, coluna 1 -> faz crossover?
+    u = rng.random((len(parents1), 2))
+    alpha = np.where(u[:, 1:] < pc, u[:, :1], 1.0)
+    beta = 1 - alpha
+
+    if out is None:
+        out = (np.empty_like(parents1), np.empty_like(parents2))
+    c1, c2 = out
+
+    np.multiply(alpha, parents1, out=c1)
+    c1 += beta * parents2
+
+    m = len(c2)
+    np.multiply(alpha[:m], parents2[:m], out=c2)
+    c2 += beta[:m] * parents1[:m]
+    return c1, c2
+
+def mutate_batch(children, pm=0.1, sigma_t=0.005, sigma_k=0.002, out=None, rng=None,
+                 problem=None):
+    """
+    Mutação gaussiana em t e k (cada gene com prob. pm)
+    e clipping nos limites de `problem` (None -> PROBLEM).
+    Retorna uma nova matriz, ou escreve em `out` (que pode ser o
+    próprio `children`).
+    """
+    rng = np.random.default_rng(rng)
+    sigma = np.array([sigma_t, sigma_k])
+    low, high = np.array((PROBLEM if problem is None else problem).bounds).T.copy()
+
+    mask = rng.random(children.shape) < pm
+    noise = rng.standard_normal(children.shape) * sigma
+    return np.clip(children + np.where(mask, noise, 0.0), low, high, out=out)
+
+
+def generation_step(pop, fitnesses, rng, out=None, pc=0.9, pm=0.1,
+                    k_tour=3, sigma_t=0.005, sigma_k=0.002, timer=None, problem=None):
+    """
+    Próxima população inteira: o melhor indivíduo (elitismo) mais
+    pop_size - 1 filhos de torneio, crossover e mutação em bloco.
+
+    Layout de `out`: [elite, c1 de cada par, c2 de cada par].
+    `out` não pode ser o mesmo array de `pop`.
+    timer: timing.PhaseTimer opcional (tempo por operador).
+    problem: limites da mutação (None -> PROBLEM).
+    """
+    pop_size = len(pop)
+    n_children = pop_size - 1
+    n_pairs = (n_children + 1) // 2
+
+    if out is None:
+        out = np.empty_like(pop)
+
+    winners = tournament_selection_batch(fitnesses, 2 * n_pairs, k_tour=k_tour, rng=rng)
+    parents1 = pop[winners[:n_pairs]]
+    parents2 = pop[winners[n_pairs:]]
+    if timer is not None:
+        timer.lap("selection")
+
+    out[0] = pop[np.argmin(fitnesses)]
+    if timer is not None:
+        timer.lap("assembly")
+
+    children = out[1:]
+    crossover_batch(
+        parents1, parents2, pc=pc,
+        out=(children[:n_pairs], children[n_pairs:]), rng=rng
+    )
+    if timer is not None:
+        timer.lap("crossover")
+
+    mutate_batch(children, pm=pm, sigma_t=sigma_t, sigma_k=sigma_k,
+                 out=children, rng=rng, problem=problem)
+    if timer is not None:
+        timer.lap("mutation")
+    return out
+
+
+# ============================================
+#  ITERADOR SOBRE AS GERAÇÕES
+#  - Um retrato leve por geração (engine.GenerationSnapshot)
+#  - run_GA abaixo é construído em cima dele
+# ============================================
+def iter_GA(
+    pop_size=16,
+    generations=100,
+    pc=0.9,
+    pm=0.1,
+    penalty_factor=1e6,
+    k_tour=3,
+    sigma_t=0.005,
+    sigma_k=0.002,
+    seed=None,
+    cache=None,
+    stop=None,
+    resume=None,
+    timer=None,
+    init="uniform",
+    memetic=None,
+    backend="auto",
+    problem=None
+):
+    """
+    Mesmos parâmetros de run_GA (menos verbose). Cada item é um
+    GenerationSnapshot: generation, best_individual ([t, k]),
+    best_fitness, mean_fitness, worst_fitness e best_Q.
+    Ao fim do laço, run.result traz o estado final (RunSummary).
+
+    resume: engine.EngineState de um checkpoint (população e RNG
+            vêm dele; seed é ignorada).
+    timer: timing.PhaseTimer opcional.
+    """
+    problem = PROBLEM if problem is None else as_problem(problem)
+    if problem.GENES != ("t", "k"):
+        raise ValueError(f"placa_plana_ga otimiza genomas [t, k]; {type(problem).__name__} "
+                         f"usa {list(problem.GENES)} (use cilindro_ga.run_GA)")
+    memetic = make_memetic(memetic)
+    rng = np.random.default_rng(seed)
+    pop = (init_population(pop_size, rng=rng, method=init, problem=problem)
+           if resume is None else None)
+
+    if resolve_backend(backend, pop_size, generations, timer) == "numba":
+        # Import do numba e carga dos kernels aqui, fora do tempo medido
+        load_kernels()
+        low, high = np.array(problem.bounds).T.copy()
+        if timer is not None:
+            timer.merged["assembly"] = ("selection", "crossover", "mutation", "assembly")
+
+        def evaluate(pop, out):
+            return fused_fitness(pop, problem, penalty_factor, out=out)
+
+        def step(pop, fitnesses, rng, out):
+            # Kernel único: o tempo todo vai para "assembly" (timer.merged)
+            fused_step(pop, fitnesses, rng, out, low, high, pc=pc, pm=pm,
+                       k_tour=k_tour, sigma_t=sigma_t, sigma_k=sigma_k)
+            if timer is not None:
+                timer.lap("assembly")
+            return out
+    else:
+        def evaluate(pop, out):
+            return fitness_batch(pop, penalty_factor, out=out, problem=problem)
+
+        def step(pop, fitnesses, rng, out):
+            return generation_step(pop, fitnesses, rng, out=out, pc=pc, pm=pm,
+                                   k_tour=k_tour, sigma_t=sigma_t, sigma_k=sigma_k,
+                                   timer=timer, problem=problem)
+
+    def best_Q(ind):
+        return problem.heat_flow(ind[1], ind[0])
+
+    config = {
+        "model": "placa",
+        "pop_size": pop_size,
+        "generations": generations,
+        "pc": pc,
+        "pm": pm,
+        "penalty_factor": penalty_factor,
+        "k_tour": k_tour,
+        "sigma_t": sigma_t,
+        "sigma_k": sigma_k,
+        "init": init,
+        "memetic": None if memetic is None else memetic.to_config(),
+        "backend": backend,
+        "problem": problem.to_config(),
+    }
+
+    refine = None
+    if memetic is not None:
+        def refine(generation, pop, fitnesses):
+            return memetic(generation, problem, problem.bounds, pop, fitnesses, penalty_factor)
+
+    return GARun(pop, evaluate, step, best_Q, generations, rng,
+                 cache=cache, stop=stop, config=config, resume=resume, timer=timer,
+                 refine=refine)
+
+
 # ============================================
 #  LOOP PRINCIPAL DO GA (k e t OTIMIZADOS JUNTOS)
 #  + HISTÓRICO PARA PLOTAR GRÁFICOS
@@ -119,92 +358,134 @@ def run_GA(
     pc=0.9,
     pm=0.1,
     penalty_factor=1e6,
-    verbose=True
+    verbose=True,
+    k_tour=3,
+    sigma_t=0.005,
+    sigma_k=0.002,
+    seed=None,
+    cache=None,
+    stop=None,
+    checkpoint=None,
+    resume=None,
+    history_store=None,
+    timing=None,
+    init="uniform",
+    memetic=None,
+    backend="auto",
+    problem=None
 ):
-    pop = init_population(pop_size)
-    fitnesses = np.array([fitness(ind, penalty_factor) for ind in pop])
-
-    # Listas pra salvar evolução do MELHOR indivíduo
-    best_t_hist = []
-    best_k_hist = []
-    best_Q_hist = []
-
-    # Listas pra MELHOR, PIOR e MÉDIA de fitness da população
-    best_fit_hist  = []
-    worst_fit_hist = []
-    mean_fit_hist  = []
+    """
+    seed: int, np.random.SeedSequence ou np.random.Generator.
+          Cada execução tem seu próprio gerador; para réplicas
+          independentes use np.random.SeedSequence(s).spawn(n).
+    cache: fitness_cache.FitnessCache opcional; genomas repetidos
+           (elite, t == t_min, k == k_max, ...) não são reavaliados.
+    stop: critério (ou lista) de stopping.py; com parada antecipada
+          os históricos terminam na última geração executada e
+          history["stop_reason"] guarda o motivo.
+    checkpoint: checkpoint.Checkpointer opcional; grava população,
+                fitness, estado do RNG e históricos parciais.
+    resume: checkpoint.Checkpoint carregado (use checkpoint.resume_GA).
+    history_store: history_store.HistoryStore opcional; os históricos
+                   vão direto para arquivos em disco (memória constante)
+                   e saem em `history` como visões np.memmap. Ao retomar,
+                   abra o mesmo diretório com mode="a".
+    timing: True, timing.PhaseTimer ou função hook(registro) para medir
+            o tempo de cada fase por geração; o resumo sai em
+            history["timing"] (None quando desligado).
+    init: população inicial ("uniform", "lhs", "sobol" ou "feasible";
+          ver init_population).
+    memetic: True, dicionário ou memetic.Memetic para refinar as elites
+             com passos de Newton / gradiente projetado a cada poucas
+             gerações (as avaliações extras entram em "evaluations").
+    backend: "auto", "numpy" ou "numba" (kernels.py: variação e fitness
+             compilados, resultado idêntico ao NumPy). "auto" usa Numba
+             quando instalado e o trabalho compensa a carga dos kernels
+             (kernels.resolve_backend), e NumPy com timing ligado. Com
+             "numba" e timing, seleção, crossover e mutação entram em
+             "assembly" (history["timing"]["merged"]).
+    problem: problems.ConvectiveCylinder (ou dicionário de to_config())
+             a otimizar; None usa PROBLEM. Vai para o config dos
+             checkpoints, então resume_GA retoma com a mesma física.
+    """
+    problem = PROBLEM if problem is None else as_problem(problem)
+    timer = make_timer(timing)
+
+    partial = {
+        # Listas pra salvar evolução do MELHOR indivíduo
+        "t": [], "k": [], "Q": [],
+        # Listas pra MELHOR, PIOR e MÉDIA de fitness da população
+        "best_fit": [], "worst_fit": [], "mean_fit": [],
+    }
+    if history_store is not None:
+        history_store.set_columns(list(partial))
+        if resume is not None:
+            resume_store(history_store, resume.state.generation + 1)
+        partial = history_store
+    elif resume is not None:
+        for name, values in resume.histories.items():
+            partial[name] = list(values)
+
+    def report(snap):
+        t_best, k_best = snap.best_individual
+        print(
+            f"Geração {snap.generation:3d} | "
+            f"t* = {t_best*1000:.2f} mm | "
+            f"k* = {k_best:.5f} W/m.K | "
+            f"Q(t*,k*) = {snap.best_Q:.3f} W | "
+            f"BestFit = {snap.best_fitness:.3e} | "
+            f"MeanFit = {snap.mean_fitness:.3e} | "
+            f"WorstFit = {snap.worst_fitness:.3e}"
+        )
+
+    run = iter_GA(
+        pop_size, generations, pc, pm, penalty_factor, k_tour,
+        sigma_t, sigma_k, seed, cache=cache, stop=stop,
+        resume=None if resume is None else resume.state, timer=timer,
+        init=init, memetic=memetic, backend=backend, problem=problem
+    )
+    snap = None
+    for snap in run:
+        # Salva histórico desta geração
+        t_best, k_best = snap.best_individual
+        row = (t_best, k_best, snap.best_Q,
+               snap.best_fitness, snap.worst_fitness, snap.mean_fitness)
+        if history_store is None:
+            for values, value in zip(partial.values(), row):
+                values.append(value)
+        else:
+            history_store.append(row)
 
-    for gen in range(generations):
-        new_pop = []
+        if verbose and snap.generation % 10 == 0:
+            report(snap)
 
-        # Estatísticas da população nesta geração
-        best_idx   = np.argmin(fitnesses)
-        worst_idx  = np.argmax(fitnesses)
-        best_fit   = fitnesses[best_idx]
-        worst_fit  = fitnesses[worst_idx]
-        mean_fit   = np.mean(fitnesses)
+        if checkpoint is not None:
+            checkpoint.maybe_save(run, partial)
 
-        best_ind = pop[best_idx].copy()
+    final = run.result
 
-        # Salva histórico desta geração
-        t_best, k_best = best_ind
-        Q_best = heat_flow(k_best, t_best)
-
-        best_t_hist.append(t_best)
-        best_k_hist.append(k_best)
-        best_Q_hist.append(Q_best)
-
-        best_fit_hist.append(best_fit)
-        worst_fit_hist.append(worst_fit)
-        mean_fit_hist.append(mean_fit)
-
-        # Elitismo: guarda o melhor
-        new_pop.append(best_ind)
-
-        # Gera o resto
-        while len(new_pop) < pop_size:
-            p1 = tournament_selection(pop, fitnesses)
-            p2 = tournament_selection(pop, fitnesses)
-
-            c1, c2 = crossover(p1, p2, pc=pc)
-            c1 = mutate(c1, pm=pm)
-            c2 = mutate(c2, pm=pm)
-
-            new_pop.append(c1)
-            if len(new_pop) < pop_size:
-                new_pop.append(c2)
-
-        pop = np.array(new_pop)
-        fitnesses = np.array([fitness(ind, penalty_factor) for ind in pop])
-
-        if verbose and (gen % 10 == 0 or gen == generations - 1):
-            print(
-                f"Geração {gen:3d} | "
-                f"t* = {t_best*1000:.2f} mm | "
-                f"k* = {k_best:.5f} W/m.K | "
-                f"Q(t*,k*) = {Q_best:.3f} W | "
-                f"BestFit = {best_fit:.3e} | "
-                f"MeanFit = {mean_fit:.3e} | "
-                f"WorstFit = {worst_fit:.3e}"
-            )
+    # Última geração (se ainda não foi impressa)
+    if verbose and snap is not None and snap.generation % 10 != 0:
+        report(snap)
 
     # Resultado final
-    best_idx = np.argmin(fitnesses)
-    t_best, k_best = pop[best_idx]
-    Q_best = heat_flow(k_best, t_best)
+    t_best, k_best = final.best_individual
+    Q_best = problem.heat_flow(k_best, t_best)
 
     print("\n===== RESULTADO FINAL DO GA (k e t) =====")
     print(f"Espessura ótima t* : {t_best*1000:.3f} mm")
     print(f"Condutividade ótima k*: {k_best:.5f} W/m.K")
-    print(f"Fluxo de calor Q(t*,k*): {Q_best:.3f} W (limite {Q_max} W)")
+    print(f"Fluxo de calor Q(t*,k*): {Q_best:.3f} W (limite {problem.Q_max} W)")
+    if final.stop_reason != "generations":
+        print(f"Parada antecipada: {final.stop_reason} após {final.generations} gerações")
 
     history = {
-        "t": np.array(best_t_hist),
-        "k": np.array(best_k_hist),
-        "Q": np.array(best_Q_hist),
-        "best_fit":  np.array(best_fit_hist),
-        "mean_fit":  np.array(mean_fit_hist),
-        "worst_fit": np.array(worst_fit_hist),
+        **history_arrays(partial),
+        # fitness de (t_best, k_best), da população final (depois da última variação)
+        "best_fitness": final.best_fitness,
+        "stop_reason": final.stop_reason,
+        "evaluations": final.evaluations,
+        "timing": None if timer is None else timer.summary(),
     }
     return t_best, k_best, Q_best, history
 
@@ -222,40 +503,9 @@ if __name__ == "__main__":
         verbose=True
     )
 
-    gens = np.arange(len(history["best_fit"]))
-
-    # Gráfico 1: Fitness (melhor, média, pior)
-    plt.figure(figsize=(8, 5))
-    plt.plot(gens, history["best_fit"],  label="Melhor fitness")
-    plt.plot(gens, history["mean_fit"],  label="Média da população")
-    plt.plot(gens, history["worst_fit"], label="Pior fitness")
-    plt.xlabel("Geração")
-    plt.ylabel("Fitness")
-    plt.title("Convergência do GA - Melhor, Média e Pior Fitness")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-
-    # Gráfico 2: t e k
-    plt.figure(figsize=(8, 5))
-    plt.plot(gens, history["t"] * 1000, label="t (mm)")
-    plt.plot(gens, history["k"],         label="k (W/m.K)")
-    plt.xlabel("Geração")
-    plt.ylabel("Valores")
-    plt.title("Evolução de t e k do melhor indivíduo")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-
-    # Gráfico 3: Q
-    plt.figure(figsize=(8, 5))
-    plt.plot(gens, history["Q"], label="Q(k,t)")
-    plt.axhline(Q_max, linestyle="--", label="Q_max = 120 W")
-    plt.xlabel("Geração")
-    plt.ylabel("Fluxo de calor [W]")
-    plt.title("Evolução do fluxo de calor Q(k,t)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-
-    plt.show()
+    # Gráficos: fitness, t e k, Q (arquivos PNG, sem janela)
+    from reporting import render_report
+
+    result = (t_best, k_best, Q_best, history)
+    for path in render_report(result, "resultados", name="placa", Q_max=PROBLEM.Q_max):
+        print(f"Gráfico salvo em {path}")
@@ -0,0 +1,296 @@
+# ============================================================
+#  Problemas físicos como objetos (em vez de globais de módulo)
+#  - Cada Problem é um dataclass congelado (frozen, slots) com
+#    os parâmetros do cenário; heat_flow, objective e bounds
+#    trabalham com a população inteira de uma vez
+#  - InsulatedCylinder : modelo de cilindro_ga (genoma [k, t])
+#  - ConvectiveCylinder: modelo de placa_plana_ga, com convecção
+#    externa (genoma [t, k])
+#  - Qualquer Problem roda no mesmo GA:
+#        cilindro_ga.run_GA(None, problem=ConvectiveCylinder(h=15.0))
+#  - Cenários diferentes são instâncias diferentes: podem ser
+#    avaliados lado a lado no mesmo processo ou em paralelo
+#  - Os campos também aceitam arrays: as fórmulas fazem
+#    broadcast, então um Problem pode representar uma grade
+#    inteira de cenários (ver sweep.py)
+#  - min_thickness(k) / optimum(): solução inversa exata (forma
+#    fechada no cilindro, Newton com salvaguarda de bisseção no
+#    modelo convectivo), referência para medir a precisão do GA
+#  - heat_flow_grad / base_gradient: derivadas analíticas usadas
+#    no refinamento local (memetic.py)
+# ============================================================
+
+from collections import namedtuple
+from dataclasses import asdict, dataclass, fields
+
+import numpy as np
+
+# Ótimo restrito exato de um Problem (arrays com a forma dos cenários)
+Optimum = namedtuple("Optimum", ["k", "t", "Q", "fitness", "feasible"])
+
+
+@dataclass(frozen=True, slots=True)
+class Problem:
+    """
+    Base dos problemas. Subclasses definem os campos físicos,
+    GENES (ordem das colunas do genoma), heat_flow, objective e bounds.
+    """
+
+    GENES = ()
+
+    def heat_flow(self, k, t):
+        raise NotImplementedError
+
+    def heat_flow_grad(self, k, t):
+        """(Q, dQ/dk, dQ/dt) em cada ponto."""
+        raise NotImplementedError
+
+    def base_gradient(self):
+        """(d/dk, d/dt) da parte do fitness sem penalidades (constantes)."""
+        raise NotImplementedError
+
+    def objective(self, population, penalty_factor=None, out=None):
+        raise NotImplementedError
+
+    @property
+    def bounds(self):
+        raise NotImplementedError
+
+    def split(self, genomes):
+        """Colunas (k, t) de `genomes` (..., n_var), na ordem do modelo."""
+        return genomes[..., self.GENES.index("k")], genomes[..., self.GENES.index("t")]
+
+    def join(self, k, t):
+        """Genomas (..., n_var) a partir de k e t (com broadcast)."""
+        columns = dict(zip(("k", "t"), np.broadcast_arrays(k, t)))
+        return np.stack([columns[gene] for gene in self.GENES], axis=-1)
+
+    def Q(self, genomes):
+        """Fluxo de calor de cada genoma (ou de um indivíduo)."""
+        return self.heat_flow(*self.split(genomes))
+
+    def min_thickness(self, k):
+        """Menor t >= t_min com Q(k, t) <= Q_max (pode passar de t_max)."""
+        raise NotImplementedError
+
+    def _round_up(self, k, t):
+        """
+        Sobe t (1, 2, 4, ... ulps) onde o arredondamento deixou Q um
+        pouco acima de Q_max, para o resultado ser viável de fato.
+        """
+        step = np.spacing(np.abs(t))
+        for _ in range(60):
+            over = self.heat_flow(k, t) > self.Q_max
+            if not over.any():
+                break
+            t = np.where(over, t + step, t)
+            step = 2 * step
+        return t
+
+    def optimum(self):
+        """
+        Ótimo restrito exato. Nos dois modelos a espessura mínima
+        cresce com k e o fitness também, então o ótimo fica em
+        k = k_min, t = min_thickness(k_min). feasible indica se esse
+        t cabe em [t_min, t_max] (senão não há ponto viável na caixa).
+        """
+        k = np.broadcast_to(np.asarray(self.k_min, dtype=float), self.scenario_shape)
+        t = self.min_thickness(k)
+        feasible = t <= self.t_max
+        return Optimum(k, t, self.heat_flow(k, t), self.objective(self.join(k, t)), feasible)
+
+    @property
+    def scenario_shape(self):
+        """Forma (broadcast) dos campos; () para um único cenário."""
+        return np.broadcast_shapes(*(np.shape(getattr(self, f.name)) for f in fields(self)))
+
+    def to_config(self):
+        """Dicionário serializável (JSON) com o tipo e os parâmetros."""
+        return {"type": type(self).__name__, **asdict(self)}
+
+
+def _store(values, out):
+    if out is None:
+        return values
+    np.copyto(out, values)
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class InsulatedCylinder(Problem):
+    """
+    Cilindro com isolamento (cilindro_ga):
+        Q = 2 * pi * k * L * dT / ln(r2/r1),   r2 = r1 + t
+    Minimiza t com Q <= Q_max e k <= k_max (penalidades quadráticas).
+    """
+
+    r1: float = 0.5          # raio interno [m]
+    L: float = 2.0           # comprimento [m]
+    dT: float = 180.0        # diferença de temperatura [°C]
+    Q_max: float = 120.0     # limite de fluxo de calor [W]
+    k_min: float = 0.02      # faixa de busca de k [W/m.K]
+    k_max: float = 0.084
+    t_min: float = 0.005     # faixa de busca de t [m]
+    t_max: float = 0.08
+    penalty_factor: float = 1e4
+
+    GENES = ("k", "t")
+
+    def heat_flow(self, k, t):
+        r2 = self.r1 + t
+        return (2 * np.pi * k * self.L * self.dT) / np.log(r2 / self.r1)
+
+    def heat_flow_grad(self, k, t):
+        r2 = self.r1 + t
+        log_ratio = np.log(r2 / self.r1)
+        Q = (2 * np.pi * k * self.L * self.dT) / log_ratio
+        return Q, Q / k, -Q / (log_ratio * r2)
+
+    def base_gradient(self):
+        return 0.0, 1.0
+
+    def min_thickness(self, k):
+        """
+        Q cai com t, então Q <= Q_max equivale a
+            t >= r1 * (exp(2 pi k L dT / Q_max) - 1)
+        """
+        t = self.r1 * np.expm1(2 * np.pi * k * self.L * self.dT / self.Q_max)
+        return np.maximum(self._round_up(k, t), self.t_min)
+
+    def objective(self, population, penalty_factor=None, out=None):
+        """
+        Fitness de cada linha [k, t]: t + penalidades onde Q > Q_max
+        e k > k_max (mesmos valores de cilindro_ga.objective).
+        """
+        pf = self.penalty_factor if penalty_factor is None else penalty_factor
+        k, t = self.split(population)
+
+        Q = self.heat_flow(k, t)
+        fitness = t + np.where(Q > self.Q_max, pf * np.square(Q - self.Q_max), 0.0)
+        fitness += np.where(k > self.k_max, pf * np.square(k - self.k_max), 0.0)
+        return _store(fitness, out)
+
+    @property
+    def bounds(self):
+        return [(self.k_min, self.k_max), (self.t_min, self.t_max)]
+
+
+@dataclass(frozen=True, slots=True)
+class ConvectiveCylinder(Problem):
+    """
+    Cilindro isolado com convecção externa (placa_plana_ga):
+        Q = 2 pi L dT / [ ln(r_o/r_i)/k + 1/(h r_o) ],   r_o = r_i + t
+    Minimiza t_norm + k_norm com Q <= Q_max; fora dos limites o
+    fitness vale 1e9.
+    """
+
+    r_i: float = 0.03        # raio interno [m]
+    L: float = 1.0           # comprimento [m]
+    T_i: float = 500.0       # temperatura interna [°C]
+    T_inf: float = 75.0      # temperatura externa [°C]
+    h: float = 10.0          # convecção externa [W/m².K]
+    Q_max: float = 120.0     # limite de calor [W]
+    t_min: float = 0.025     # faixa de busca de t [m]
+    t_max: float = 0.200
+    k_min: float = 0.050     # faixa de busca de k [W/m.K]
+    k_max: float = 0.084
+    penalty_factor: float = 1e6
+
+    GENES = ("t", "k")
+
+    @property
+    def dT(self):
+        return self.T_i - self.T_inf
+
+    def heat_flow(self, k, t):
+        r_o = self.r_i + t
+        denom = np.log(r_o / self.r_i) / k + 1.0 / (self.h * r_o)
+        return 2.0 * np.pi * self.L * self.dT / denom
+
+    def heat_flow_grad(self, k, t):
+        r_o = self.r_i + t
+        log_ratio = np.log(r_o / self.r_i)
+        R = log_ratio / k + 1.0 / (self.h * r_o)
+        Q = 2.0 * np.pi * self.L * self.dT / R
+        dR_dk = -log_ratio / (k * k)
+        dR_dt = 1.0 / (k * r_o) - 1.0 / (self.h * r_o * r_o)
+        return Q, -Q * dR_dk / R, -Q * dR_dt / R
+
+    def base_gradient(self):
+        return 1.0 / (self.k_max - self.k_min), 1.0 / (self.t_max - self.t_min)
+
+    def _resistance(self, k, r_o):
+        return np.log(r_o / self.r_i) / k + 1.0 / (self.h * r_o)
+
+    def min_thickness(self, k, rtol=1e-13, max_iter=100):
+        """
+        Q <= Q_max equivale a R(r_o) >= R_req = 2 pi L dT / Q_max, com
+        R(r_o) = ln(r_o/r_i)/k + 1/(h r_o). R cai até o raio crítico
+        r_c = k/h e cresce depois dele:
+        - se r_i + t_min já atende, a resposta é t_min;
+        - senão a raiz está no ramo crescente, entre max(r_i + t_min, r_c)
+          e r_i exp(k R_req); resolvida com Newton (bisseção quando o
+          passo sai do intervalo), todos os casos de uma vez.
+        """
+        k = np.asarray(k, dtype=float)
+        shape = np.broadcast_shapes(k.shape, self.scenario_shape)
+        k = np.broadcast_to(k, shape)
+        r_i = np.broadcast_to(self.r_i, shape)
+        R_req = np.broadcast_to(2.0 * np.pi * self.L * self.dT / self.Q_max, shape)
+
+        r0 = r_i + self.t_min
+        at_min = self._resistance(k, r0) >= R_req
+
+        # Intervalo da raiz no ramo crescente: R(lo) < R_req < R(hi)
+        lo = np.maximum(r0, k / self.h)
+        hi = np.maximum(r_i * np.exp(k * R_req), lo)
+        r = hi.copy()
+        for _ in range(max_iter):
+            f = self._resistance(k, r) - R_req
+            lo = np.where(f < 0, r, lo)
+            hi = np.where(f > 0, r, hi)
+
+            df = 1.0 / (k * r) - 1.0 / (self.h * r * r)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r_new = r - f / df
+            bad = ~((r_new > lo) & (r_new < hi))
+            r_new = np.where(bad, 0.5 * (lo + hi), r_new)
+
+            done = np.abs(r_new - r) <= rtol * r_new
+            r = r_new
+            if done.all():
+                break
+
+        return np.where(at_min, self.t_min, self._round_up(k, r - r_i))
+
+    def objective(self, population, penalty_factor=None, out=None):
+        """
+        Fitness de cada linha [t, k] (mesmos valores de
+        placa_plana_ga.fitness).
+        """
+        pf = self.penalty_factor if penalty_factor is None else penalty_factor
+        k, t = self.split(population)
+
+        inside = (self.t_min <= t) & (t <= self.t_max) & (self.k_min <= k) & (k <= self.k_max)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Q = self.heat_flow(k, t)
+
+        t_norm = (t - self.t_min) / (self.t_max - self.t_min)
+        k_norm = (k - self.k_min) / (self.k_max - self.k_min)
+        penalty = np.where(Q > self.Q_max, np.square(Q - self.Q_max) * pf, 0.0)
+        return _store(np.where(inside, t_norm + k_norm + penalty, 1e9), out)
+
+    @property
+    def bounds(self):
+        return [(self.t_min, self.t_max), (self.k_min, self.k_max)]
+
+
+PROBLEMS = {cls.__name__: cls for cls in (InsulatedCylinder, ConvectiveCylinder)}
+
+
+def as_problem(problem):
+    """Problem a partir de um Problem ou de um dicionário de to_config()."""
+    if isinstance(problem, Problem):
+        return problem
+    config = dict(problem)
+    return PROBLEMS[config.pop("type")](**config)
@@ -0,0 +1,125 @@
+# ============================================================
+#  Relatórios gráficos das execuções do GA
+#  - Separado dos solvers: matplotlib só é importado quando um
+#    gráfico é de fato desenhado (workers de lote não pagam o
+#    import nem precisam de display)
+#  - Usa Figure + canvas Agg diretamente (sem pyplot), então
+#    renderiza PNG/SVG sem janela e sem estado global; vários
+#    relatórios podem ser gerados em processos paralelos
+#  - Aceita o resultado de qualquer run_GA (dicionário do
+#    cilindro ou tupla da placa)
+# ============================================================
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from runner import as_result_dict
+
+
+def _figure(figsize=(8, 5)):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _series(result):
+    """Séries por geração de qualquer run_GA (None se o modelo não registra)."""
+    result = as_result_dict(result)
+    history = result.get("history", {})
+    return {
+        "best": result["best_hist"],
+        "mean": result["avg_hist"],
+        "worst": result["worst_hist"],
+        "t": history.get("t", result.get("best_t_hist")),
+        "k": history.get("k"),
+        "Q": history.get("Q", result.get("best_Q_hist")),
+    }
+
+
+# ---------- GRÁFICOS ----------
+def plot_fitness(ax, series, title="Convergência do GA - Melhor, Média e Pior Fitness"):
+    gens = np.arange(len(series["best"]))
+    ax.plot(gens, series["best"], label="Melhor fitness")
+    ax.plot(gens, series["mean"], label="Média da população", linestyle="--")
+    ax.plot(gens, series["worst"], label="Pior fitness", linestyle=":")
+    ax.set_xlabel("Geração")
+    ax.set_ylabel("Fitness")
+    ax.set_title(title)
+    ax.grid(True)
+    ax.legend()
+
+
+def plot_tk(ax, series, title="Evolução de t e k do melhor indivíduo"):
+    gens = np.arange(len(series["t"]))
+    ax.plot(gens, np.asarray(series["t"]) * 1000, label="t (mm)")
+    if series["k"] is not None:
+        ax.plot(gens, series["k"], label="k (W/m.K)")
+    ax.set_xlabel("Geração")
+    ax.set_ylabel("Valores")
+    ax.set_title(title)
+    ax.grid(True)
+    ax.legend()
+
+
+def plot_Q(ax, series, Q_max=None, title="Evolução do fluxo de calor Q(k,t)"):
+    gens = np.arange(len(series["Q"]))
+    ax.plot(gens, series["Q"], label="Q(k,t)")
+    if Q_max is not None:
+        ax.axhline(Q_max, linestyle="--", color="k", label=f"Q_max = {Q_max:g} W")
+    ax.set_xlabel("Geração")
+    ax.set_ylabel("Fluxo de calor [W]")
+    ax.set_title(title)
+    ax.grid(True)
+    ax.legend()
+
+
+# ---------- RELATÓRIO ----------
+def render_report(result, out_dir, name="ga", Q_max=None, formats=("png",), dpi=120):
+    """
+    Desenha os gráficos de uma execução em `out_dir`:
+        <name>_fitness.<fmt>, <name>_tk.<fmt>, <name>_Q.<fmt>
+    (t/k e Q só quando o resultado traz essas séries).
+    Devolve a lista de arquivos gravados.
+    """
+    series = _series(result)
+    plots = [("fitness", lambda ax: plot_fitness(ax, series))]
+    if series["t"] is not None:
+        plots.append(("tk", lambda ax: plot_tk(ax, series)))
+    if series["Q"] is not None:
+        plots.append(("Q", lambda ax: plot_Q(ax, series, Q_max)))
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for suffix, draw in plots:
+        fig = _figure()
+        draw(fig.add_subplot())
+        fig.tight_layout()
+        for fmt in formats:
+            path = os.path.join(out_dir, f"{name}_{suffix}.{fmt}")
+            fig.savefig(path, dpi=dpi)
+            paths.append(path)
+    return paths
+
+
+def _render_job(job):
+    name, result, kwargs = job
+    return render_report(result, name=name, **kwargs)
+
+
+def render_reports(results, out_dir, max_workers=None, **kwargs):
+    """
+    Renderiza vários relatórios em processos paralelos.
+
+    results: dict {nome: resultado de run_GA} (ou pares (nome, resultado)).
+    kwargs: repassados a render_report (Q_max, formats, dpi).
+    Devolve {nome: lista de arquivos}.
+    """
+    items = results.items() if isinstance(results, dict) else results
+    jobs = [(name, result, dict(kwargs, out_dir=out_dir)) for name, result in items]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip((job[0] for job in jobs), pool.map(_render_job, jobs)))
@@ -0,0 +1,310 @@
+# ============================================================
+#  Execução paralela de várias sementes do GA
+#  - Distribui run_GA (cilindro_ga ou placa_plana_ga) por um
+#    ProcessPoolExecutor, uma semente por tarefa
+#  - Devolve os resultados conforme terminam
+#  - Agrega best/avg/worst em faixas de percentis sem guardar
+#    todos os históricos (estimador P² por geração; as primeiras
+#    `warmup` observações são guardadas e dão percentis exatos)
+# ============================================================
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+
+# ---------- SEMENTES ----------
+def spawn_seeds(entropy, n):
+    """
+    n sementes independentes (SeedSequence) derivadas de `entropy`.
+    Podem ser passadas direto como `seed` de run_GA.
+    """
+    return np.random.SeedSequence(entropy).spawn(n)
+
+
+# ---------- NORMALIZAÇÃO DO RESULTADO ----------
+def as_result_dict(result):
+    """
+    Coloca o resultado de qualquer run_GA no formato de dicionário
+    de cilindro_ga (best_individual, best_fitness, best_hist, ...).
+
+    placa_plana_ga.run_GA devolve (t_best, k_best, Q_best, history);
+    o histórico original fica em result["history"].
+    """
+    if isinstance(result, dict):
+        return result
+
+    t_best, k_best, Q_best, history = result
+    return {
+        "best_individual": np.array([t_best, k_best]),
+        "best_fitness": history["best_fitness"],
+        "best_Q": Q_best,
+        "best_hist": history["best_fit"],
+        "worst_hist": history["worst_fit"],
+        "avg_hist": history["mean_fit"],
+        "stop_reason": history.get("stop_reason", "generations"),
+        "evaluations": history.get("evaluations"),
+        "history": history,
+    }
+
+
+def _run_one(run_fn, seed, kwargs):
+    result = as_result_dict(run_fn(seed=seed, **kwargs))
+    result["seed"] = seed
+    return result
+
+
+# ---------- EXECUÇÃO EM PARALELO ----------
+def run_seeds(run_fn, seeds, max_workers=None, **kwargs):
+    """
+    Executa run_fn(seed=s, **kwargs) para cada semente em processos
+    separados e devolve (gerador) os dicionários de resultado na ordem
+    em que terminam. Cada dicionário traz a chave "seed".
+
+    run_fn precisa ser uma função de módulo (picklable), por exemplo
+    cilindro_ga.run_GA ou placa_plana_ga.run_GA.
+    Só ~2 * max_workers sementes ficam submetidas de cada vez (uma nova
+    entra quando outra termina), então no máximo esse número de
+    resultados fica na memória, qualquer que seja len(seeds).
+    Se o consumidor parar antes do fim, as tarefas pendentes são canceladas.
+    """
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    seeds = iter(seeds)
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {pool.submit(_run_one, run_fn, seed, kwargs)
+                   for seed in itertools.islice(seeds, window)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for seed in itertools.islice(seeds, len(done)):
+                pending.add(pool.submit(_run_one, run_fn, seed, kwargs))
+            while done:
+                yield done.pop().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ---------- PERCENTIS EM STREAMING (P²) ----------
+class StreamingPercentiles:
+    """
+    Estimador P² (Jain & Chlamtac, 1985) vetorizado: acompanha vários
+    percentis de cada posição de uma série (ex.: cada geração) usando
+    5 marcadores por percentil, sem guardar as observações.
+
+    As primeiras `warmup` observações de cada posição são guardadas:
+    até lá os percentis são exatos, e os marcadores do P² partem dos
+    quantis dessa amostra (com só 5 pontos o P² devolveria a mediana
+    para todos os percentis). Custo: 8 * warmup bytes por posição
+    enquanto ela ainda não passou de `warmup` observações; depois a
+    amostra é liberada e sobram só os marcadores.
+
+    Séries mais curtas (execuções que pararam antes) atualizam só
+    as primeiras posições.
+    """
+
+    def __init__(self, percentiles=(5, 25, 50, 75, 95), warmup=64):
+        if warmup < 5:
+            raise ValueError("warmup precisa ser >= 5")
+        self.percentiles = np.asarray(percentiles, dtype=float)
+        self.warmup = warmup
+        self._p = self.percentiles[:, None] / 100.0      # (n_p, 1)
+        self._length = 0
+        self._count = np.zeros(0, dtype=np.int64)         # (G,)
+        # Observações iniciais das posições _b0.. (as anteriores já
+        # passaram de warmup; como toda série começa na posição 0,
+        # count é não crescente e essas posições formam um prefixo)
+        self._buf = np.zeros((0, warmup))
+        self._b0 = 0
+        self._q = np.zeros((len(self._p), 0, 5))          # alturas
+        self._n = np.zeros((len(self._p), 0, 5))          # posições
+        self._grow(0)
+
+    def _grow(self, length):
+        if length <= self._length:
+            return
+        extra = length - self._length
+        n_p = len(self._p)
+        self._count = np.concatenate([self._count, np.zeros(extra, dtype=np.int64)])
+        self._buf = np.concatenate([self._buf, np.zeros((extra, self.warmup))])
+        self._q = np.concatenate([self._q, np.zeros((n_p, extra, 5))], axis=1)
+        self._n = np.concatenate([self._n, np.tile(np.arange(5.0), (n_p, extra, 1))], axis=1)
+        self._length = length
+
+    def update(self, series):
+        """Acrescenta uma observação para cada posição de `series`."""
+        x = np.asarray(series, dtype=float)
+        L = len(x)
+        self._grow(L)
+
+        count = self._count[:L]
+        q = self._q[:, :L]
+        n = self._n[:, :L]
+
+        # Fase inicial: as `warmup` primeiras observações são guardadas
+        init = count < self.warmup
+        if init.any():
+            cols = np.nonzero(init)[0]
+            self._buf[cols - self._b0, count[cols]] = x[cols]
+            full = cols[count[cols] == self.warmup - 1]
+            if len(full):
+                self._start_markers(full)
+
+        active = np.nonzero(~init)[0]
+        if len(active):
+            self._p2_step(q, n, count, active, x[active])
+
+        count += 1
+        self._release()
+
+    def _release(self):
+        """Libera a amostra das posições que já passaram de warmup."""
+        done = np.searchsorted(-self._count, -self.warmup, side="left")
+        if done > self._b0:
+            self._buf = self._buf[done - self._b0:].copy()
+            self._b0 = done
+
+    def _start_markers(self, cols):
+        """
+        Marcadores das posições `cols` a partir da amostra guardada:
+        posições 0, p/2, p, (1+p)/2 e 1 (arredondadas, estritamente
+        crescentes) e, como altura, o valor ordenado em cada uma.
+        """
+        N = self.warmup
+        p = self._p
+        fracs = np.concatenate([np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)], axis=-1)
+        pos = np.rint((N - 1) * fracs)                    # (n_p, 5)
+        for i in (1, 2, 3):
+            pos[:, i] = np.maximum(pos[:, i], pos[:, i - 1] + 1)
+        for i in (3, 2, 1):
+            pos[:, i] = np.minimum(pos[:, i], pos[:, i + 1] - 1)
+
+        ordered = np.sort(self._buf[cols - self._b0], axis=-1)   # (m, N)
+        self._q[:, cols] = np.moveaxis(ordered[:, pos.astype(np.intp)], 0, 1)
+        self._n[:, cols] = pos[:, None, :]
+
+    def _p2_step(self, q, n, count, cols, x):
+        qa = q[:, cols]                # (n_p, m, 5)
+        na = n[:, cols]
+        p = self._p[:, :, None]        # (n_p, 1, 1)
+
+        # Ajusta os extremos e encontra a célula de x
+        qa[..., 0] = np.minimum(qa[..., 0], x)
+        qa[..., 4] = np.maximum(qa[..., 4], x)
+        cell = (x[None, :, None] >= qa[..., 1:4]).sum(axis=-1)   # 0..3
+        na += (np.arange(5) > cell[..., None])
+
+        # Posições desejadas depois de N = count + 1 observações
+        N = (count[cols] + 1)[None, :, None].astype(float)
+        desired = (N - 1) * np.concatenate(
+            [np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)], axis=-1
+        )
+
+        for i in (1, 2, 3):
+            d = desired[..., i] - na[..., i]
+            move = ((d >= 1) & (na[..., i + 1] - na[..., i] > 1)) | \
+                   ((d <= -1) & (na[..., i - 1] - na[..., i] < -1))
+            if not move.any():
+                continue
+            s = np.sign(d) * move
+
+            n_lo, n_i, n_hi = na[..., i - 1], na[..., i], na[..., i + 1]
+            q_lo, q_i, q_hi = qa[..., i - 1], qa[..., i], qa[..., i + 1]
+
+            # Interpolação parabólica
+            with np.errstate(divide="ignore", invalid="ignore"):
+                parab = q_i + s / (n_hi - n_lo) * (
+                    (n_i - n_lo + s) * (q_hi - q_i) / (n_hi - n_i)
+                    + (n_hi - n_i - s) * (q_i - q_lo) / (n_i - n_lo)
+                )
+                # Fallback linear quando a parábola sai do intervalo
+                q_nb = np.where(s > 0, q_hi, q_lo)
+                n_nb = np.where(s > 0, n_hi, n_lo)
+                linear = q_i + s * (q_nb - q_i) / (n_nb - n_i)
+
+            ok = (q_lo < parab) & (parab < q_hi)
+            new_q = np.where(ok, parab, linear)
+            qa[..., i] = np.where(move, new_q, q_i)
+            na[..., i] = n_i + s
+
+        q[:, cols] = qa
+        n[:, cols] = na
+
+    @property
+    def count(self):
+        """Número de observações em cada posição."""
+        return self._count.copy()
+
+    def result(self):
+        """
+        Estimativas (n_percentis, comprimento). Posições com até
+        `warmup` observações usam o percentil exato dos valores guardados.
+        """
+        out = self._q[:, :, 2].copy()
+        exact = (self._count > 0) & (self._count <= self.warmup)
+        for c in np.unique(self._count[exact]):
+            cols = np.nonzero(self._count == c)[0]
+            out[:, cols] = np.percentile(self._buf[cols - self._b0, :c], self.percentiles,
+                                         axis=1)
+        out[:, self._count == 0] = np.nan
+        return out
+
+
+class HistoryBands:
+    """
+    Faixas de percentis de best/avg/worst por geração, agregadas
+    resultado a resultado (memória constante no número de sementes).
+    """
+
+    def __init__(self, keys=("best_hist", "avg_hist", "worst_hist"),
+                 percentiles=(5, 25, 50, 75, 95)):
+        self.keys = tuple(keys)
+        self.percentiles = tuple(percentiles)
+        self.n_runs = 0
+        self._est = {key: StreamingPercentiles(percentiles) for key in self.keys}
+
+    def add(self, result):
+        result = as_result_dict(result)
+        for key in self.keys:
+            self._est[key].update(result[key])
+        self.n_runs += 1
+
+    def bands(self):
+        """{chave: array (n_percentis, gerações)}"""
+        return {key: est.result() for key, est in self._est.items()}
+
+
+def aggregate_seeds(run_fn, seeds, max_workers=None,
+                    percentiles=(5, 25, 50, 75, 95), on_result=None, **kwargs):
+    """
+    Roda todas as sementes em paralelo e agrega os históricos em
+    faixas de percentis. Cada resultado é descartado depois de
+    agregado; `on_result(result)` permite guardar o que interessar
+    (ex.: só best_fitness).
+    """
+    bands = HistoryBands(percentiles=percentiles)
+    for result in run_seeds(run_fn, seeds, max_workers=max_workers, **kwargs):
+        bands.add(result)
+        if on_result is not None:
+            on_result(result)
+    return bands
+
+
+# ---------- EXECUÇÃO ----------
+if __name__ == "__main__":
+    import cilindro_ga
+
+    bounds = [(0.02, cilindro_ga.PROBLEM.k_max), (0.005, 0.08)]
+    finals = []
+
+    bands = aggregate_seeds(
+        cilindro_ga.run_GA, spawn_seeds(0, 64),
+        on_result=lambda r: finals.append(r["best_fitness"]),
+        bounds=bounds,
+    )
+
+    med = bands.bands()["best_hist"][bands.percentiles.index(50)]
+    print(f"Execuções          : {bands.n_runs}")
+    print(f"Mediana final best : {med[-1]:.6g}")
+    print(f"Melhor / pior final: {min(finals):.6g} / {max(finals):.6g}")
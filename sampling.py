@@ -0,0 +1,147 @@
+# ============================================================
+#  Estratégias de população inicial
+#  - "uniform" : sorteio uniforme na caixa (padrão de sempre)
+#  - "lhs"     : hipercubo latino (cada gene estratificado em
+#                pop_size faixas)
+#  - "sobol"   : sequência de Sobol (direções de Joe & Kuo) com
+#                deslocamento digital aleatório
+#  - "feasible": LHS em k e demais genes; t sorteado entre a
+#                espessura mínima viável (Problem.min_thickness)
+#                e t_max, concentrado perto da fronteira Q = Q_max,
+#                onde fica o ótimo
+#  - `size` pode ter eixos à frente (modo empilhado): cada
+#    execução recebe a sua própria amostra
+# ============================================================
+
+import numpy as np
+
+METHODS = ("uniform", "lhs", "sobol", "feasible")
+
+# Direções de Sobol (Joe & Kuo, new-joe-kuo-6.21201): (s, a, m_1..m_s)
+# para as dimensões 2..16; a dimensão 1 usa m_k = 1.
+_JOE_KUO = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+)
+SOBOL_MAX_DIM = len(_JOE_KUO) + 1
+_BITS = 32
+
+
+def _sobol_directions(dim):
+    """Números de direção v[d, b] (inteiros de 32 bits), d < dim."""
+    if dim > SOBOL_MAX_DIM:
+        raise ValueError(f"sobol suporta até {SOBOL_MAX_DIM} genes (pedido: {dim})")
+    v = np.zeros((dim, _BITS), dtype=np.uint64)
+    v[0] = [1 << (_BITS - 1 - b) for b in range(_BITS)]
+    for d in range(1, dim):
+        s, a, m = _JOE_KUO[d - 1]
+        for b in range(_BITS):
+            if b < s:
+                v[d, b] = m[b] << (_BITS - 1 - b)
+            else:
+                value = v[d, b - s] ^ (v[d, b - s] >> np.uint64(s))
+                for j in range(1, s):
+                    if (a >> (s - 1 - j)) & 1:
+                        value ^= v[d, b - j]
+                v[d, b] = value
+    return v
+
+
+# ---------- AMOSTRAS NO CUBO UNITÁRIO ----------
+def latin_hypercube(size, dim, rng):
+    """
+    Pontos (size..., dim) em [0, 1): em cada gene, o último eixo de
+    `size` (n pontos) tem exatamente um ponto em cada faixa [i/n, (i+1)/n).
+    """
+    size = tuple(np.atleast_1d(size))
+    n = size[-1]
+    strata = np.broadcast_to(np.arange(n)[:, None], size + (dim,))
+    strata = rng.permuted(strata, axis=-2)
+    return (strata + rng.random(size + (dim,))) / n
+
+
+def sobol(size, dim, rng):
+    """
+    Primeiros n pontos (size..., dim) da sequência de Sobol, com um
+    deslocamento digital aleatório (XOR) por execução; n = size[-1].
+    Potências de 2 em n preservam a estratificação da sequência.
+    """
+    size = tuple(np.atleast_1d(size))
+    n = size[-1]
+    v = _sobol_directions(dim)
+
+    index = np.arange(n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    points = np.zeros((n, dim), dtype=np.uint64)
+    for b in range(max(int(n - 1).bit_length(), 1)):
+        bit = ((gray >> np.uint64(b)) & np.uint64(1)).astype(bool)
+        points[bit] ^= v[:, b]
+
+    shift = rng.integers(0, 1 << _BITS, size=size[:-1] + (1, dim), dtype=np.uint64)
+    return (points ^ shift) / float(1 << _BITS)
+
+
+# ---------- POPULAÇÕES ----------
+def uniform(size, bounds, rng):
+    """Sorteio uniforme, gene a gene (mesma ordem de sorteio dos GAs)."""
+    size = tuple(np.atleast_1d(size))
+    pop = np.empty(size + (len(bounds),))
+    for i, (low, high) in enumerate(bounds):
+        pop[..., i] = rng.uniform(low, high, size=size)
+    return pop
+
+
+def toward_boundary(pop, bounds, problem, rng, concentration=3.0):
+    """
+    Troca o gene t de `pop` (no lugar) por um valor entre a espessura
+    mínima viável para o k de cada indivíduo e t_max:
+        t = t_b + (t_max - t_b) * u**concentration
+    concentration > 1 concentra os pontos junto da fronteira Q = Q_max.
+    Onde nem t_max é viável, t fica em t_max (o mais perto possível).
+    """
+    i_k, i_t = problem.GENES.index("k"), problem.GENES.index("t")
+    t_low, t_high = bounds[i_t]
+    t_b = np.clip(problem.min_thickness(pop[..., i_k]), t_low, t_high)
+    u = rng.random(pop.shape[:-1])
+    pop[..., i_t] = t_b + (t_high - t_b) * u**concentration
+    return pop
+
+
+def sample(size, bounds, rng, method="uniform", problem=None):
+    """
+    População inicial (size..., n_var) dentro de `bounds`.
+
+    method: "uniform", "lhs", "sobol" ou "feasible" (precisa de
+            `problem`, com o genoma na ordem problem.GENES).
+    """
+    if method == "uniform":
+        return uniform(size, bounds, rng)
+
+    bounds_arr = np.asarray(bounds, dtype=float)
+    low, high = bounds_arr[:, 0], bounds_arr[:, 1]
+    if method in ("lhs", "feasible"):
+        u = latin_hypercube(size, len(bounds), rng)
+    elif method == "sobol":
+        u = sobol(size, len(bounds), rng)
+    else:
+        raise ValueError(f"inicialização desconhecida: {method!r} (use {', '.join(METHODS)})")
+
+    pop = low + u * (high - low)
+    if method == "feasible":
+        if problem is None:
+            raise ValueError("init='feasible' precisa de um problem")
+        toward_boundary(pop, bounds_arr, problem, rng)
+    return pop
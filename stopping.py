@@ -0,0 +1,99 @@
+# ============================================================
+#  Critérios de parada antecipada para run_GA
+#  - Cada critério é um objeto chamável que recebe o estado da
+#    geração (palavras-chave) e devolve None (continua) ou uma
+#    string com o motivo da parada
+#  - Estado passado pelo GA:
+#      generation  : índice da geração atual
+#      best_hist   : melhores fitness das últimas gerações (o laço
+#                    guarda pelo menos `window` + 1 valores para
+#                    critérios com atributo `window`)
+#      fitness     : fitness da população atual
+#      evaluations : avaliações feitas até agora
+#      elapsed     : segundos desde o início da execução
+#  - Qualquer função com a mesma assinatura também serve
+# ============================================================
+
+import numpy as np
+
+
+class Stagnation:
+    """
+    Para quando o melhor fitness não melhora mais que `tol`
+    nas últimas `window` gerações.
+    """
+
+    reason = "stagnation"
+
+    def __init__(self, window=20, tol=0.0):
+        self.window = window
+        self.tol = tol
+
+    def __call__(self, *, best_hist, **state):
+        if len(best_hist) <= self.window:
+            return None
+        if best_hist[-self.window - 1] - best_hist[-1] <= self.tol:
+            return self.reason
+        return None
+
+
+class FitnessSpread:
+    """Para quando pior - melhor fitness da população fica <= tol."""
+
+    reason = "fitness_spread"
+
+    def __init__(self, tol=1e-9):
+        self.tol = tol
+
+    def __call__(self, *, fitness, **state):
+        if np.ptp(fitness) <= self.tol:
+            return self.reason
+        return None
+
+
+class WallClock:
+    """Para quando o tempo de execução passa de `seconds`."""
+
+    reason = "wall_clock"
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __call__(self, *, elapsed, **state):
+        if elapsed >= self.seconds:
+            return self.reason
+        return None
+
+
+class EvaluationBudget:
+    """
+    Para antes de a próxima geração estourar `max_evaluations`
+    avaliações de fitness (uma por indivíduo avaliado; com cache,
+    só as que de fato chamaram a função).
+    """
+
+    reason = "evaluation_budget"
+
+    def __init__(self, max_evaluations):
+        self.max_evaluations = max_evaluations
+
+    def __call__(self, *, evaluations, fitness, **state):
+        if evaluations + len(fitness) > self.max_evaluations:
+            return self.reason
+        return None
+
+
+def check_stop(criteria, **state):
+    """
+    Primeiro motivo de parada entre `criteria` (um critério, uma
+    lista deles ou None), ou None se o GA deve continuar.
+    """
+    if criteria is None:
+        return None
+    if callable(criteria):
+        criteria = (criteria,)
+    for criterion in criteria:
+        reason = criterion(**state)
+        if reason:
+            return reason
+    return None
@@ -0,0 +1,134 @@
+# ============================================================
+#  Varredura de cenários físicos num único GA em lote
+#  - Produto cartesiano de valores de campos de um Problem
+#    (ex.: 200 valores de h x 50 de Q_max x 4 raios)
+#  - Os campos varridos viram arrays (S, 1): heat_flow e o
+#    fitness fazem broadcast contra a população empilhada
+#    (S, pop_size, n_var) de cilindro_ga.run_GA_stacked
+#  - Todas as S otimizações avançam juntas, geração a geração
+#  - design_table() achata o resultado numa tabela de projeto
+#  - Cada cenário é conferido com o ótimo exato
+#    (Problem.optimum): t_exact e t_error no resultado
+# ============================================================
+
+import dataclasses
+
+import numpy as np
+
+import cilindro_ga
+
+# Campos que definem os limites de busca (iguais em toda a grade)
+BOUND_FIELDS = ("t_min", "t_max", "k_min", "k_max")
+
+
+def scenario_grid(base, **axes):
+    """
+    Problem com um cenário por combinação dos valores de `axes`.
+
+    base: problems.Problem com os valores fixos.
+    axes: campo -> valores (1-D), ex. h=np.linspace(5, 50, 200).
+
+    Retorna (problem, shape): campos varridos com forma (S, 1),
+    S = prod(shape), na ordem C da grade `shape`.
+    """
+    swept = [name for name in axes if name in BOUND_FIELDS]
+    if swept:
+        raise ValueError(f"os limites de busca não podem ser varridos: {swept}")
+
+    values = [np.asarray(v, dtype=float).ravel() for v in axes.values()]
+    shape = tuple(len(v) for v in values)
+    grids = np.meshgrid(*values, indexing="ij")
+    fields = {name: grid.reshape(-1, 1) for name, grid in zip(axes, grids)}
+    return dataclasses.replace(base, **fields), shape
+
+
+def run_sweep(
+    base,
+    axes,
+    pop_size=50,
+    generations=100,
+    crossover_rate=0.8,
+    mutation_rate=0.3,
+    mutation_scale=0.3,
+    penalty_factor=None,
+    seed=42
+):
+    """
+    Otimiza todos os cenários da grade `axes` (dict campo -> valores)
+    num único run_GA_stacked.
+
+    Retorna o dicionário de run_GA_stacked com o eixo de execuções
+    trocado pela forma da grade (ex.: best_hist (200, 50, 4, generations)),
+    mais:
+        "axes"    : dict campo -> valores
+        "k", "t"  : melhor k e t de cada cenário
+        "Q"       : fluxo de calor do melhor indivíduo
+        "feasible": Q <= Q_max do próprio cenário
+        "t_exact" : espessura do ótimo exato (Problem.optimum)
+        "t_error" : (t - t_exact) / t_exact, NaN onde não há ótimo viável
+    """
+    problem, shape = scenario_grid(base, **axes)
+    n_scenarios = int(np.prod(shape))
+
+    result = cilindro_ga.run_GA_stacked(
+        None, n_scenarios, pop_size, generations, crossover_rate,
+        mutation_rate, mutation_scale, penalty_factor, seed, problem=problem
+    )
+
+    best = result["best_individual"]
+    k, t = problem.split(best)
+    Q = problem.Q(best[:, None, :])[:, 0]
+    Q_max = np.broadcast_to(problem.Q_max, (n_scenarios, 1))[:, 0]
+
+    exact = problem.optimum()
+    t_exact = exact.t[:, 0]
+    t_error = np.where(exact.feasible[:, 0], (t - t_exact) / t_exact, np.nan)
+
+    out = {name: arr.reshape(shape + arr.shape[1:]) for name, arr in result.items()}
+    out.update(
+        axes={name: np.asarray(v, dtype=float).ravel() for name, v in axes.items()},
+        k=k.reshape(shape),
+        t=t.reshape(shape),
+        Q=Q.reshape(shape),
+        feasible=(Q <= Q_max).reshape(shape),
+        t_exact=t_exact.reshape(shape),
+        t_error=t_error.reshape(shape),
+    )
+    return out
+
+
+def design_table(result):
+    """
+    Tabela de projeto (dict de colunas 1-D, uma linha por cenário):
+    os valores dos campos varridos seguidos de t, k, Q, feasible,
+    t_exact e t_error.
+    """
+    axes = result["axes"]
+    grids = np.meshgrid(*axes.values(), indexing="ij")
+    table = {name: grid.ravel() for name, grid in zip(axes, grids)}
+    for name in ("t", "k", "Q", "feasible", "t_exact", "t_error"):
+        table[name] = result[name].ravel()
+    return table
+
+
+# ---------- EXECUÇÃO ----------
+if __name__ == "__main__":
+    from problems import ConvectiveCylinder
+
+    res = run_sweep(
+        ConvectiveCylinder(),
+        {"h": np.linspace(5.0, 50.0, 200),
+         "Q_max": np.linspace(80.0, 200.0, 50),
+         "r_i": [0.02, 0.03, 0.05]},
+        pop_size=40, generations=80, seed=0,
+    )
+    table = design_table(res)
+
+    print(f"Cenários otimizados: {len(table['t'])}")
+    print(f"Viáveis            : {table['feasible'].mean():.1%}")
+    print(f"Erro relativo em t : mediana {np.nanmedian(np.abs(table['t_error'])):.2e}, "
+          f"máximo {np.nanmax(np.abs(table['t_error'])):.2e}")
+    print(" h [W/m².K]  Q_max [W]  r_i [m]   t* [mm]   k* [W/m.K]  Q [W]")
+    for i in np.linspace(0, len(table["t"]) - 1, 8).astype(int):
+        print(f"{table['h'][i]:10.2f} {table['Q_max'][i]:10.1f} {table['r_i'][i]:8.3f} "
+              f"{table['t'][i]*1000:9.2f} {table['k'][i]:11.5f} {table['Q'][i]:8.2f}")
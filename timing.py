@@ -0,0 +1,116 @@
+# ============================================================
+#  Tempo por fase do laço de gerações
+#  - Fases: evaluation, selection, crossover, mutation,
+#    assembly (elitismo / montagem da nova população),
+#    refinement (busca local de memetic.py) e bookkeeping
+#    (estatísticas, históricos, checkpoints, critérios de parada)
+#  - O motor chama lap(fase) ao fim de cada trecho: cada volta
+#    custa uma leitura de time.perf_counter; sem PhaseTimer o
+#    laço só testa `timer is not None`
+#  - hook(registro) recebe um dict por geração; summary() vai
+#    para o resultado de run_GA
+# ============================================================
+
+import time
+
+PHASES = ("evaluation", "selection", "crossover", "mutation", "assembly", "refinement",
+          "bookkeeping")
+
+
+class PhaseTimer:
+    """
+    Acumula o tempo de cada fase, geração a geração.
+
+    hook(record): chamado ao fim de cada geração com
+        {"generation", <fase>: segundos, ..., "evaluations",
+         "evaluations_per_second"}
+    keep: guarda os registros por geração em `records`
+          (desligado por padrão: memória constante).
+    """
+
+    def __init__(self, hook=None, keep=False):
+        self.hook = hook
+        self.records = [] if keep else None
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.generations = 0
+        self.evaluations = 0
+        self._current = dict.fromkeys(PHASES, 0.0)
+        # fase -> fases medidas juntas nela (ex. kernel único do Numba)
+        self.merged = {}
+        self._evaluations0 = None
+        self._t = None
+
+    def start(self, evaluations=0):
+        """Marca o início da contagem (antes da primeira avaliação)."""
+        self._evaluations0 = evaluations
+        self._t = time.perf_counter()
+
+    def lap(self, phase):
+        """Soma à fase o tempo desde a última marca."""
+        now = time.perf_counter()
+        self._current[phase] += now - self._t
+        self._t = now
+
+    def end_generation(self, generation, evaluations):
+        """Fecha a geração; `evaluations` é o total acumulado do motor."""
+        current = self._current
+        n_evals = evaluations - self._evaluations0
+        self._evaluations0 = evaluations
+
+        for phase in PHASES:
+            self.totals[phase] += current[phase]
+        self.generations += 1
+        self.evaluations += n_evals
+
+        if self.hook is not None or self.records is not None:
+            record = {"generation": generation, **current, "evaluations": n_evals,
+                      "evaluations_per_second": _rate(n_evals, current["evaluation"])}
+            if self.records is not None:
+                self.records.append(record)
+            if self.hook is not None:
+                self.hook(record)
+        self._current = dict.fromkeys(PHASES, 0.0)
+
+    def summary(self):
+        """
+        Totais por fase (s), fração do tempo medido, média por geração,
+        fase dominante e avaliações por segundo (só na fase de
+        avaliação e no tempo total medido). "merged" diz quais fases
+        foram medidas juntas numa só (as outras ficam em 0).
+        """
+        total = sum(self.totals.values())
+        n = max(self.generations, 1)
+        return {
+            "generations": self.generations,
+            "total": total,
+            "phases": dict(self.totals),
+            "fraction": {p: (t / total if total else 0.0) for p, t in self.totals.items()},
+            "per_generation": {p: t / n for p, t in self.totals.items()},
+            "dominant": max(self.totals, key=self.totals.get),
+            "evaluations": self.evaluations,
+            "evaluations_per_second": _rate(self.evaluations, self.totals["evaluation"]),
+            "evaluations_per_second_wall": _rate(self.evaluations, total),
+            "merged": dict(self.merged),
+        }
+
+
+def _rate(count, seconds):
+    if seconds > 0:
+        return count / seconds
+    return float("inf") if count else 0.0
+
+
+def make_timer(timing):
+    """
+    Normaliza o parâmetro `timing` de run_GA: None/False -> None,
+    True -> PhaseTimer(), PhaseTimer -> ele mesmo, função -> PhaseTimer(hook=função).
+    """
+    if timing is None or timing is False:
+        return None
+    if timing is True:
+        return PhaseTimer()
+    if isinstance(timing, PhaseTimer):
+        return timing
+    if callable(timing):
+        return PhaseTimer(hook=timing)
+    raise TypeError(f"timing inválido: {timing!r}")